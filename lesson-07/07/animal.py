@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+# flyweight table: one shared string object per distinct kind
+KINDS: dict[str, str] = {}
+
+class Animal(ABC):
+    # see __slots__ (https://docs.python.org/3/reference/datamodel.html#slots)
+    __slots__ = ("__kind", "name", "legs")
+
+    def __init__(self, kind: str, name: str, legs: int):
+        """
+        The first step when creating a new object
+        """
+
+        self.__kind = KINDS.setdefault(kind, kind)
+        self.name = name
+        self.legs = legs
+
+    def hello(self):
+        print("My name is {}. I am {}.".format(self.name, self.__kind))
+
+    @abstractmethod
+    def run(self):
+        raise NotImplementedError("Subclasses must implement abstract method")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Compare memory and attribute access of the lesson-07/05 classes with the slotted ones
+
+import gc
+import timeit
+import tracemalloc
+from main import Dog as SlottedDog
+
+COUNT = 1_000_000
+
+class Animal:
+
+    def __init__(self, kind: str, name: str, legs: int):
+        self.__kind = kind
+        self.name = name
+        self.legs = legs
+
+class Dog(Animal):
+
+    def __init__(self, kind: str, name: str):
+        super().__init__(kind, name, 4)
+
+def create(cls, names: list[str]) -> tuple[list, int]:
+    gc.collect()
+    tracemalloc.start()
+    # every record brings its own copy of the kind, like rows parsed from a file
+    dogs = [cls("".join(["Shi", "ba"]), name) for name in names]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dogs, size
+
+if __name__ == "__main__":
+    names = ["dog{}".format(i) for i in range(COUNT)]
+
+    classes = {"__dict__": Dog, "__slots__": SlottedDog}
+
+    print("Memory per {} instances".format(COUNT))
+    for label, cls in classes.items():
+        dogs, size = create(cls, names)
+        print("{:10} {:8.1f} MB".format(label, size / 2**20))
+        del dogs
+
+    number = 10 * COUNT
+    print("\nRead name and legs {} times".format(number))
+    for label, cls in classes.items():
+        seconds = timeit.timeit("dog.name; dog.legs", globals={"dog": cls("Shiba", "Maru")}, number=number)
+        print("{:10} {:8.3f} s".format(label, seconds))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+import sys
+from animal import Animal
+
+class Dog(Animal):
+    # an empty __slots__ keeps subclasses without __dict__ as well
+    __slots__ = ()
+
+    def __init__(self, kind: str, name: str):
+        super().__init__(kind, name, 4)
+
+    def run(self):
+        print("I can run by {} legs".format(self.legs))
+
+class Bird(Animal):
+    __slots__ = ()
+
+    def __init__(self, kind: str, name: str):
+        super().__init__(kind, name, 2)
+
+    def run(self):
+        print("I can jump by {} legs".format(self.legs))
+
+if __name__ == "__main__":
+    puppy = Dog(kind="Shiba", name="Maru")
+    puppy.hello()
+    puppy.run()
+
+    eagle = Bird(kind="Sea Eagle", name="Andro")
+    eagle.hello()
+    eagle.run()
+
+    try:
+        # failed to add an attribute which is not in __slots__
+        puppy.color = "brown"
+    except AttributeError as e:
+        print("[Error]", e, file=sys.stderr)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+from bisect import bisect_right
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+import random
+import timeit
+from zoneinfo import ZoneInfo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TransitionTable:
+
+    def __init__(self, zone: ZoneInfo, start: datetime, end: datetime, step: timedelta = timedelta(hours=12)):
+        """
+        Precompute the UTC offset transitions of a zone between start and end.
+
+        The zone is sampled every `step` and each offset change is narrowed
+        down to the exact second with a binary search.
+        """
+
+        self.zone = zone
+        self.start = int(start.timestamp())
+        self.end = int(end.timestamp())
+
+        stride = int(step.total_seconds())
+        self.transitions = [self.start]
+        self.offsets = [self._offset(self.start)]
+        for ts in range(self.start + stride, self.end + stride, stride):
+            ts = min(ts, self.end)
+            if self._offset(ts) != self.offsets[-1]:
+                at = self._locate(ts - stride, ts)
+                self.transitions.append(at)
+                self.offsets.append(self._offset(at))
+
+        if np is not None:
+            self._np_transitions = np.array(self.transitions, dtype=np.int64)
+            self._np_offsets = np.array(self.offsets, dtype=np.int64)
+
+    def _offset(self, ts: int) -> int:
+        return int(datetime.fromtimestamp(ts, self.zone).utcoffset().total_seconds())
+
+    def _locate(self, lo: int, hi: int) -> int:
+        # offset(lo) is the old offset and offset(hi) is the new one
+        before = self._offset(lo)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self._offset(mid) == before:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    def _check_range(self, low: int, high: int):
+        if low < self.start or high > self.end:
+            raise ValueError("Timestamp out of the precomputed range")
+
+    def utcoffset(self, ts: int) -> int:
+        """Return the UTC offset in seconds of a single epoch timestamp."""
+        self._check_range(ts, ts)
+        return self.offsets[bisect_right(self.transitions, ts) - 1]
+
+    def to_local(self, epochs):
+        """
+        Convert epoch seconds to local wall-clock seconds (epoch + offset).
+
+        A NumPy array is converted with one vectorized search, any other
+        sequence falls back to bisect per value.
+        """
+
+        if np is not None and isinstance(epochs, np.ndarray):
+            if len(epochs):
+                self._check_range(int(epochs.min()), int(epochs.max()))
+            index = np.searchsorted(self._np_transitions, epochs, side="right") - 1
+            return epochs + self._np_offsets[index]
+
+        if epochs:
+            self._check_range(min(epochs), max(epochs))
+        transitions = self.transitions
+        offsets = self.offsets
+        return [ts + offsets[bisect_right(transitions, ts) - 1] for ts in epochs]
+
+def to_local_naive(table: TransitionTable, epochs) -> list[int]:
+    """Reference conversion with one aware datetime per value."""
+    epoch = datetime(1970, 1, 1)
+    return [int((datetime.fromtimestamp(ts, table.zone).replace(tzinfo=None) - epoch).total_seconds()) for ts in epochs]
+
+if __name__ == "__main__":
+    zone = ZoneInfo("America/New_York")
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    table = TransitionTable(zone, start, end)
+    print("{} transitions for {} between {} and {}".format(len(table.transitions), zone, start.year, end.year))
+
+    # verify against zoneinfo
+    epochs = [random.randrange(table.start, table.end) for _ in range(100_000)]
+    epochs += table.transitions + [ts - 1 for ts in table.transitions[1:]]
+    assert table.to_local(epochs) == to_local_naive(table, epochs)
+    print("Verified {} timestamps against zoneinfo".format(len(epochs)))
+
+    # benchmark
+    number = 5
+    print("\nConvert {} timestamps".format(len(epochs)))
+    print("astimezone   : {:.4f} s".format(timeit.timeit(lambda: to_local_naive(table, epochs), number=number) / number))
+    print("bisect       : {:.4f} s".format(timeit.timeit(lambda: table.to_local(epochs), number=number) / number))
+    if np is not None:
+        array = np.array(epochs, dtype=np.int64)
+        assert table.to_local(array).tolist() == to_local_naive(table, epochs)
+        print("searchsorted : {:.4f} s".format(timeit.timeit(lambda: table.to_local(array), number=number) / number))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+from datetime import datetime
+from datetime import timedelta
+import re
+import time
+import timeit
+
+# C locale names, the same as strftime() prints by default
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTHS = ["", "January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+
+# precomputed field tables
+TABLES = {
+    "D2": [f"{i:02d}" for i in range(100)],
+    "D3": [f"{i:03d}" for i in range(367)],
+    "H12": [f"{(i % 12) or 12:02d}" for i in range(24)],
+    "AMPM": ["AM"] * 12 + ["PM"] * 12,
+    "WD": WEEKDAYS,
+    "WDS": [name[:3] for name in WEEKDAYS],
+    "MN": MONTHS,
+    "MNS": [name[:3] for name in MONTHS],
+}
+
+# directive -> expression over `t` and the field tables
+DIRECTIVES = {
+    "Y": "t.year",
+    "y": "D2[t.year % 100]",
+    "m": "D2[t.month]",
+    "d": "D2[t.day]",
+    "H": "D2[t.hour]",
+    "I": "H12[t.hour]",
+    "p": "AMPM[t.hour]",
+    "M": "D2[t.minute]",
+    "S": "D2[t.second]",
+    "f": "t.microsecond:06d",
+    "j": "D3[t.timetuple().tm_yday]",
+    "a": "WDS[t.weekday()]",
+    "A": "WD[t.weekday()]",
+    "b": "MNS[t.month]",
+    "B": "MN[t.month]",
+}
+
+def compile_format(pattern: str):
+    """
+    Compile a strftime pattern into a function that formats a datetime.
+
+    The pattern is parsed once and turned into a single f-string over the
+    field tables. Patterns with directives that are not supported fall back
+    to datetime.strftime().
+    """
+
+    parts = []
+    for literal, directive in re.findall(r"([^%]*)(%.?)?", pattern):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if not directive:
+            continue
+        if directive == "%%":
+            parts.append("%")
+        elif directive[1:] in DIRECTIVES:
+            parts.append("{" + DIRECTIVES[directive[1:]] + "}")
+        else:
+            return lambda t: t.strftime(pattern)
+
+    source = "lambda t: f{!r}".format("".join(parts))
+    return eval(source, dict(TABLES))
+
+class NowFormatter:
+
+    def __init__(self, pattern: str):
+        """
+        Format the current local time, memoized per second.
+
+        Only patterns without sub-second fields can be memoized.
+        """
+
+        if "%f" in pattern:
+            raise ValueError("Pattern with %f cannot be memoized per second")
+
+        self.format = compile_format(pattern)
+        self.second = None
+        self.text = None
+
+    def __call__(self) -> str:
+        second = int(time.time())
+        if second != self.second:
+            self.text = self.format(datetime.fromtimestamp(second))
+            self.second = second
+        return self.text
+
+if __name__ == "__main__":
+    patterns = ["%a %b %d, %Y", "%Y-%m-%d %H:%M:%S", "%I:%M %p on %A, %B %d (%j)"]
+
+    # verify against strftime
+    start = datetime(2000, 1, 1)
+    values = [start + timedelta(seconds=i * 7919) for i in range(100_000)]
+    for pattern in patterns:
+        fmt = compile_format(pattern)
+        assert all(fmt(t) == t.strftime(pattern) for t in values), pattern
+    print("Verified {} patterns against strftime".format(len(patterns)))
+
+    now = NowFormatter("%Y-%m-%d %H:%M:%S")
+    print("\nCurrent time")
+    print(now())
+
+    # benchmark 10M values
+    number = 100
+    print("\nFormat {} values".format(len(values) * number))
+    for pattern in patterns:
+        fmt = compile_format(pattern)
+        baseline = timeit.timeit(lambda: [t.strftime(pattern) for t in values], number=number)
+        compiled = timeit.timeit(lambda: [fmt(t) for t in values], number=number)
+        print("{:28} strftime: {:.2f} s, compiled: {:.2f} s".format(pattern, baseline, compiled))
+
+    number = 1_000_000
+    baseline = timeit.timeit(lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"), number=number)
+    memoized = timeit.timeit(now, number=number)
+    print("\nFormat now() {} times".format(number))
+    print("strftime: {:.2f} s, memoized: {:.2f} s".format(baseline, memoized))
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import lru_cache
+import re
+import timeit
+
+try:
+    from dateutil.parser import parse as dateutil_parse
+except ImportError:
+    dateutil_parse = None
+
+MONTHS = {name: i for i, names in enumerate([
+    (), ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+    ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+    ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+]) for name in names}
+WEEKDAYS = {"mon", "monday", "tue", "tuesday", "wed", "wednesday", "thu", "thursday",
+            "fri", "friday", "sat", "saturday", "sun", "sunday"}
+UTC_NAMES = {"utc", "gmt", "z"}
+
+# shape of a string: every digit becomes "9", everything else is kept
+SHAPE = str.maketrans("0123456789", "9999999999")
+TOKEN = re.compile(r"\d+|[A-Za-z]+|\S")
+
+def _century(year: int) -> int:
+    # the same two-digit year rule as dateutil: within 50 years of today
+    this_year = datetime.now().year
+    year += this_year // 100 * 100
+    if year >= this_year + 50:
+        year -= 100
+    elif year < this_year - 50:
+        year += 100
+    return year
+
+class FastParser:
+
+    def __init__(self, tzinfos: dict | None = None):
+        """
+        Parse date strings like dateutil.parser.parse().
+
+        A string is interpreted once per shape (its digits replaced by "9").
+        The interpretation is memoized as a template of slice positions, so
+        later strings with the same shape are parsed by slicing only. Shapes
+        that are not understood, or are ambiguous, are passed to dateutil
+        when it is installed.
+        """
+
+        self.tzinfos = {}
+        for name, tz in (tzinfos or {}).items():
+            self.tzinfos[name.lower()] = timezone(timedelta(seconds=tz), name) if isinstance(tz, int) else tz
+        self._template = lru_cache(maxsize=1024)(self._interpret)
+
+    def parse(self, text: str) -> datetime:
+        template = self._template(text.translate(SHAPE))
+        if template is None:
+            return self._fallback(text)
+
+        try:
+            return self._resolve(text, *template)
+        except ValueError:
+            # values the template does not fit, e.g. a two-digit year first
+            return self._fallback(text)
+
+    def _resolve(self, text: str, fields: dict, slices: tuple, swap: bool) -> datetime:
+        values = fields.copy()
+        for role, start, end in slices:
+            values[role] = int(text[start:end])
+
+        if swap and "year" in values and values["month"] > 31:
+            # 91-12-06: a first number that is neither a month nor a day is the year
+            values["year"], values["month"], values["day"] = values["month"], values["day"], values["year"]
+        elif swap and values["month"] > 12 >= values["day"]:
+            values["month"], values["day"] = values["day"], values["month"]
+
+        if "year" not in values or "month" not in values or "day" not in values:
+            today = datetime.now()
+            values.setdefault("year", today.year)
+            values.setdefault("month", today.month)
+            values.setdefault("day", today.day)
+        elif values["year"] < 100 and "century" in values:
+            values["year"] = _century(values["year"])
+
+        hour = values.get("hour", 0)
+        if "ampm" in values:
+            if not 0 <= hour <= 12:
+                raise ValueError("hour {} with AM/PM".format(hour))
+            hour = hour % 12 + values["ampm"]
+
+        tz = values.get("tz")
+        if "offset" in values:
+            tz = timezone(values["offset"] * timedelta(hours=values["tzh"], minutes=values.get("tzm", 0)))
+
+        return datetime(values["year"], values["month"], values["day"], hour,
+                        values.get("minute", 0), values.get("second", 0),
+                        values.get("fraction", 0) * values.get("scale", 0), tz)
+
+    def _fallback(self, text: str) -> datetime:
+        if dateutil_parse is None:
+            raise ValueError("Unknown string format: {}".format(text))
+        return dateutil_parse(text, tzinfos=self.tzinfos or None)
+
+    def _interpret(self, shape: str):
+        """
+        Work out the template of a shape, or None if it is not understood.
+
+        fields holds values fixed by the shape (names, signs), slices holds
+        (role, start, end) of the numbers to read from each string.
+        """
+
+        fields = {}
+        slices = []
+        dates = []
+        tokens = [(m.group(), m.start(), m.end()) for m in TOKEN.finditer(shape)]
+        # index of the token after the time, the only place for a UTC offset
+        time_end = None
+
+        i = 0
+        while i < len(tokens):
+            token, start, end = tokens[i]
+            lower = token.lower()
+            following = tokens[i + 1][0] if i + 1 < len(tokens) else ""
+
+            if token[0] == "9" and following == ":" and "hour" not in fields:
+                # time: HH:MM[:SS[.ffffff]]
+                fields["hour"] = None
+                slices.append(("hour", start, end))
+                i += 2
+                if i < len(tokens) and tokens[i][0][0] == "9":
+                    slices.append(("minute", tokens[i][1], tokens[i][2]))
+                    i += 1
+                if i < len(tokens) - 1 and tokens[i][0] == ":" and tokens[i + 1][0][0] == "9":
+                    slices.append(("second", tokens[i + 1][1], tokens[i + 1][2]))
+                    i += 2
+                if i < len(tokens) - 1 and tokens[i][0] in ".," and tokens[i + 1][0][0] == "9":
+                    digits = tokens[i + 1][2] - tokens[i + 1][1]
+                    slices.append(("fraction", tokens[i + 1][1], tokens[i + 1][1] + min(digits, 6)))
+                    fields["scale"] = 10 ** (6 - min(digits, 6))
+                    i += 2
+                time_end = i
+                continue
+
+            if token[0] == "9" and len(token) <= 2 and following.lower() in ("am", "pm") and "hour" not in fields:
+                # bare hour: 5 PM
+                fields["hour"] = None
+                slices.append(("hour", start, end))
+                i += 1
+                time_end = i
+                continue
+
+            if token in "+-" and i == time_end and following[:1] == "9":
+                # offset: +HH, +HHMM or +HH:MM
+                fields["offset"] = 1 if token == "+" else -1
+                _, start, end = tokens[i + 1]
+                if end - start == 4:
+                    slices += [("tzh", start, start + 2), ("tzm", start + 2, end)]
+                elif end - start == 2:
+                    slices.append(("tzh", start, end))
+                    if i + 3 < len(tokens) and tokens[i + 2][0] == ":" and tokens[i + 3][0] == "99":
+                        slices.append(("tzm", tokens[i + 3][1], tokens[i + 3][2]))
+                        i += 2
+                else:
+                    return None
+                i += 2
+                continue
+
+            if token[0] == "9":
+                if len(token) == 6 and i > 0 and tokens[i - 1][0] == "T" and "hour" not in fields:
+                    # compact time: HHMMSS
+                    slices += [("hour", start, start + 2), ("minute", start + 2, start + 4), ("second", start + 4, end)]
+                    fields["hour"] = None
+                    time_end = i + 1
+                elif len(token) == 8 and not dates:
+                    slices += [("year", start, start + 4), ("month", start + 4, start + 6), ("day", start + 6, end)]
+                    fields["year"] = fields["month"] = fields["day"] = None
+                else:
+                    dates.append((start, end))
+            elif lower in MONTHS:
+                fields["month"] = MONTHS[lower]
+            elif lower in ("am", "pm"):
+                fields["ampm"] = 0 if lower == "am" else 12
+            elif lower in UTC_NAMES:
+                fields["tz"] = timezone.utc
+            elif lower in self.tzinfos:
+                fields["tz"] = self.tzinfos[lower]
+            elif token.isalpha() and token.isupper() and 3 <= len(token) <= 5:
+                # unknown time zone name, ignored like dateutil does
+                pass
+            elif lower not in WEEKDAYS and lower not in ("t", "at", "on", "of") and token not in "-/.,":
+                return None
+            i += 1
+
+        if "ampm" in fields and "hour" not in fields:
+            # AM/PM without a time to apply it to
+            return None
+        if not slices and not dates and "month" not in fields:
+            # no date or time at all, e.g. a lone "T"
+            return None
+
+        # assign the remaining numbers to year, month and day
+        swap = False
+        years = [d for d in dates if d[1] - d[0] == 4]
+        if "year" not in fields and years:
+            fields["year"] = None
+            slices.append(("year", *years[0]))
+            first = dates[0] == years[0]
+            dates.remove(years[0])
+        else:
+            first = False
+
+        roles = []
+        if "month" in fields:
+            roles = ["day", "year"]
+        elif first:
+            roles = ["month", "day"]
+        elif len(dates) >= 2:
+            roles = ["month", "day", "year"]
+            swap = True
+        elif len(dates) == 1:
+            roles = ["day"]
+
+        if "year" in fields:
+            roles = [role for role in roles if role != "year"]
+        if len(dates) > len(roles):
+            return None
+        for role, (start, end) in zip(roles, dates):
+            fields[role] = None
+            slices.append((role, start, end))
+            if role == "year":
+                fields["century"] = True
+
+        for role in [role for role, value in fields.items() if value is None]:
+            del fields[role]
+        return fields, tuple(slices), swap
+
+parse = FastParser().parse
+
+# shared test corpus
+CORPUS = [
+    "2017-01-23T12:30:40+02:00",
+    "2017-01-23 12:30 CST",
+    "2018-04-13T09:39:21",
+    "2018-04-13T09:39:21.578",
+    "2018-04-13T09:39:21+0800",
+    "2018-04-13T09:39:21Z",
+    "2018-04-13 09:39:21",
+    "2018/04/13 09:39:21",
+    "Fri Apr 13 09:39:21 UTC 2018",
+    "2023-12-25",
+    "25/12/2023",
+    "12/25/2023",
+    "12/05/23",
+    "December 25, 2023",
+    "Dec 25, 2023 2:30 PM",
+    "25 Dec 2023 12:15 AM",
+    "20231225",
+    "20231225T143000",
+    "2023-12-25 14:30:00.123456 -05:00",
+    "12:30",
+    "5 PM",
+    "5:30 pm",
+    "2024-01-02 5 PM",
+    "10:00 2024-01-02",
+    "10:00 +0200 2024-01-02",
+    "2024-01-02 10:00 -0500",
+    "91-12-06",
+    "06-12-91",
+]
+
+if __name__ == "__main__":
+    for text in CORPUS:
+        print("{:36} -> {}".format(text, parse(text)))
+
+    if dateutil_parse is not None:
+        # verify against dateutil
+        import warnings
+        warnings.simplefilter("ignore")
+        for text in CORPUS:
+            expected = dateutil_parse(text)
+            actual = parse(text)
+            assert actual.replace(tzinfo=None) == expected.replace(tzinfo=None), text
+            assert actual.utcoffset() == expected.utcoffset(), text
+        print("\nVerified {} strings against dateutil".format(len(CORPUS)))
+
+    # benchmark a repetitive log format
+    start = datetime(2024, 1, 1)
+    lines = [(start + timedelta(seconds=i * 37)).strftime("%Y-%m-%d %H:%M:%S UTC") for i in range(10_000)]
+    number = 5
+    print("\nParse {} log timestamps".format(len(lines) * number))
+    print("fast    : {:.4f} s".format(timeit.timeit(lambda: [parse(line) for line in lines], number=number)))
+    if dateutil_parse is not None:
+        print("dateutil: {:.4f} s".format(timeit.timeit(lambda: [dateutil_parse(line) for line in lines], number=number)))
@@ -0,0 +1,59 @@
+import warnings
+import pytest
+from main import CORPUS
+from main import FastParser
+from main import parse
+
+dateutil_parser = pytest.importorskip("dateutil.parser")
+
+@pytest.fixture(autouse=True)
+def ignore_unknown_timezones():
+    # dateutil warns about names like CST that it ignores
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+##############################
+# Compatibility Testcases
+##############################
+@pytest.mark.parametrize("text", CORPUS)
+def test_same_as_dateutil(text):
+    expected = dateutil_parser.parse(text)
+    actual = parse(text)
+    assert actual.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert actual.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize("text, expected", [
+    ("91-12-06", (1991, 12, 6)),
+    ("99-01-31", (1999, 1, 31)),
+    ("13-01-01", (2001, 1, 13)),
+    ("01-13-01", (2001, 1, 13)),
+])
+def test_two_digit_year_first(text, expected):
+    """
+    The testcase is to test that a first number that cannot be a day or a
+    month is read as the year, and a day above 12 is not read as the month.
+    """
+
+    actual = parse(text)
+    assert (actual.year, actual.month, actual.day) == expected
+    assert actual == dateutil_parser.parse(text)
+
+@pytest.mark.parametrize("text", ["T", "02-30-2024", "25:00"])
+def test_invalid_raises(text):
+    """
+    The testcase is to test that strings dateutil rejects are rejected too,
+    rather than giving today's date or an error of another type.
+    """
+
+    with pytest.raises(ValueError):
+        dateutil_parser.parse(text)
+    with pytest.raises(ValueError):
+        parse(text)
+
+def test_template_is_memoized():
+    parser = FastParser()
+    parser.parse("2018-04-13 09:39:21")
+    parser.parse("2019-05-14 10:40:22")
+    info = parser._template.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
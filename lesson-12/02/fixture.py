@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import threading
+from urllib import request
+from urllib.parse import urlsplit
+
+class RecordedServer:
+
+    def __init__(self, fixtures: Path, record: bool | None = None):
+        """
+        Local HTTP stand-in that replays recorded responses.
+
+        Each upstream URL is served under http://127.0.0.1:<port>/<host>/<path>
+        from `fixtures/<host>/<path>` (body) and a `.json` sidecar (status and
+        headers). With `record` enabled, or RECORD_FIXTURES=1 in the
+        environment, requests are forwarded upstream and saved first.
+        """
+
+        self.fixtures = Path(fixtures)
+        self.record = record if record is not None else os.environ.get("RECORD_FIXTURES", "") in ("1", "true")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def url_for(self, url: str) -> str:
+        """Map an upstream URL to the same resource on the stand-in."""
+        parts = urlsplit(url)
+        path = "/{}{}".format(parts.netloc, parts.path or "/")
+        if parts.query:
+            path += "?" + parts.query
+        return "http://127.0.0.1:{}{}".format(self.server.server_port, path)
+
+    def _paths(self, path: str) -> tuple[Path, Path]:
+        name = path.lstrip("/").replace("?", "_")
+        if name.endswith("/"):
+            name += "index"
+        body = self.fixtures / name
+        return body, body.with_name(body.name + ".json")
+
+    def _record(self, path: str):
+        body_path, meta_path = self._paths(path)
+        with request.urlopen("https:/" + path) as response:
+            body = response.read()
+            meta = {
+                "status": response.status,
+                "headers": {"Content-Type": response.headers.get("Content-Type", "application/octet-stream")},
+            }
+
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps(meta, indent=2) + "\n")
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if stand_in.record:
+                    try:
+                        stand_in._record(self.path)
+                    except OSError as e:
+                        self.send_error(502, "Failed to record {}: {}".format(self.path, e))
+                        return
+
+                body_path, meta_path = stand_in._paths(self.path)
+                if not body_path.is_file():
+                    self.send_error(404, "No recorded fixture for {}".format(self.path))
+                    return
+
+                body = body_path.read_bytes()
+                meta = json.loads(meta_path.read_text()) if meta_path.is_file() else {"status": 200, "headers": {}}
+                self.send_response(meta["status"])
+                for key, value in meta["headers"].items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
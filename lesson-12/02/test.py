@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 import unittest
 from urllib import request
+from fixture import RecordedServer
 from xml_parser_et import parse_xml as parse
 
 class NewsTestCase(unittest.TestCase):
@@ -11,6 +12,16 @@ class NewsTestCase(unittest.TestCase):
     report = workdir / "report.log"
     xml = workdir / "example.xml"
 
+    @classmethod
+    def setUpClass(cls):
+        # serve recorded responses from localhost, RECORD_FIXTURES=1 to re-record
+        cls.server = RecordedServer(cls.workdir / "fixtures")
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
     def setUp(self):
         logging.basicConfig(
             format = "%(asctime)s [%(levelname)s] %(message)s",
@@ -22,7 +33,7 @@ class NewsTestCase(unittest.TestCase):
         self.url = "https://status.aws.amazon.com/rss/billingconsole.rss"
 
         # download news xml
-        with request.urlopen(self.url) as rss:
+        with request.urlopen(self.server.url_for(self.url)) as rss:
             data = rss.read().decode("utf-8")
 
         with open(self.xml, "w") as f:
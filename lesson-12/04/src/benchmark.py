@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import random
+import time
+import main
+from main import Division
+from main import Multiplication
+
+COUNT = 10_000_000
+
+def measure(name: str, func):
+    start = time.perf_counter()
+    func()
+    print(f"{name:24} {time.perf_counter() - start:.2f} s")
+
+if __name__ == "__main__":
+    a = [random.randint(-1000, 1000) for _ in range(COUNT)]
+    b = [random.randint(-1000, 1000) for _ in range(COUNT)]
+
+    for operation in (Multiplication(), Division()):
+        print(f"\n{type(operation).__name__} of {COUNT} pairs")
+        measure("loop over calculate", lambda: [operation.calculate(x, y) if y else None for x, y in zip(a, b)])
+
+        numpy = main.np
+        main.np = None
+        measure("calculate_many (array)", lambda: operation.calculate_many(a, b))
+        main.np = numpy
+
+        if numpy is not None:
+            measure("calculate_many (numpy)", lambda: operation.calculate_many(a, b))
+            array_a, array_b = numpy.array(a), numpy.array(b)
+            measure("calculate_many (ndarray)", lambda: operation.calculate_many(array_a, array_b))
@@ -1,10 +1,90 @@
 #!/usr/bin/env python3
 
+from array import array
+import math
+import operator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# products at or beyond this magnitude may not fit in int64
+INT64_SAFE = 2.0 ** 62
+
+def _as_numbers(seq) -> "array | list | np.ndarray":
+    """
+    Convert a batch of numbers once, instead of checking every element.
+
+    Ints beyond the int64 range are kept as a list of Python ints, so they
+    are calculated exactly instead of wrapping around or losing precision.
+    """
+
+    if np is not None:
+        values = np.asarray(seq)
+        if values.dtype.kind in "iuf":
+            return values
+        if values.dtype.kind != "O":
+            raise TypeError("Both arguments must be numbers")
+        # NumPy keeps ints beyond int64 as objects
+        seq = values.tolist()
+
+    if not isinstance(seq, (list, tuple)):
+        # an iterator could only be read once
+        seq = list(seq)
+    try:
+        return array("q", seq)
+    except OverflowError:
+        if all(isinstance(x, int) for x in seq):
+            return seq
+    except TypeError:
+        pass
+
+    try:
+        return array("d", seq)
+    except (TypeError, OverflowError):
+        raise TypeError("Both arguments must be numbers") from None
+
+def _vectorized(a, b) -> bool:
+    return np is not None and isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+
+def _python(values) -> "array | list":
+    """Values to iterate over as Python numbers, only an ndarray is converted."""
+    return values.tolist() if np is not None and isinstance(values, np.ndarray) else values
+
 class Operation:
 
     def calculate(self, a: int | float, b: int| float) -> int | float:
         raise NotImplementedError("Subclasses must implement this method")
 
+    def calculate_many(self, a_seq, b_seq) -> tuple["list | np.ndarray", "list | np.ndarray"]:
+        """
+        Calculate a batch of pairs.
+
+        Types are validated once per batch. Returns the results and a mask
+        that is True where a pair could not be calculated (its result is nan).
+        """
+
+        a = _as_numbers(a_seq)
+        b = _as_numbers(b_seq)
+        if len(a) != len(b):
+            raise ValueError("Both sequences must have the same length")
+
+        return self._calculate_many(a, b)
+
+    def _calculate_many(self, a, b) -> tuple["list | np.ndarray", "list | np.ndarray"]:
+        # fallback for subclasses without a batch implementation
+        results = []
+        mask = []
+        for x, y in zip(_python(a), _python(b)):
+            try:
+                results.append(self.calculate(x, y))
+                mask.append(False)
+            except ValueError:
+                results.append(math.nan)
+                mask.append(True)
+        return results, mask
+
 class Multiplication(Operation):
 
     def calculate(self, a: int | float, b: int | float) -> int | float:
@@ -13,6 +93,16 @@ class Multiplication(Operation):
 
         return a * b
 
+    def _calculate_many(self, a, b):
+        if _vectorized(a, b):
+            if a.dtype.kind == "f" or b.dtype.kind == "f" or not np.any(
+                    np.abs(a.astype(np.float64)) * np.abs(b.astype(np.float64)) >= INT64_SAFE):
+                return a * b, np.zeros(len(a), dtype=bool)
+            # the product would wrap around in int64, fall through to Python ints
+
+        # the items of an array are Python numbers, so the products are exact
+        return list(map(operator.mul, _python(a), _python(b))), [False] * len(a)
+
 class Division(Operation):
 
     def calculate(self, a: int | float, b: int | float) -> int | float:
@@ -24,7 +114,39 @@ class Division(Operation):
 
         return a / b
 
+    def _calculate_many(self, a, b):
+        if _vectorized(a, b):
+            mask = b == 0
+            results = a / np.where(mask, 1, b)
+            results[mask] = np.nan
+            return results, mask
+
+        a, b = _python(a), _python(b)
+        # index() scans in C, so only the zero divisors are visited in Python
+        zeros = []
+        start = 0
+        while True:
+            try:
+                start = b.index(0, start) + 1
+            except ValueError:
+                break
+            zeros.append(start - 1)
+
+        if zeros:
+            b = b[:]
+            for i in zeros:
+                b[i] = 1
+        results = list(map(operator.truediv, a, b))
+        mask = [False] * len(results)
+        for i in zeros:
+            results[i] = math.nan
+            mask[i] = True
+        return results, mask
+
 if __name__ == "__main__":
     operation = Multiplication()
     result = operation.calculate(6, 7)
     print(f"The result of multiplication is: {result}")
+
+    results, mask = Division().calculate_many([6, 7, 8], [3, 0, 2])
+    print(f"The results of batch division are: {[float(x) for x in results]} (invalid: {[bool(m) for m in mask]})")
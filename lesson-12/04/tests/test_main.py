@@ -1,3 +1,4 @@
+import math
 import pytest
 from main import Division
 from main import Multiplication
@@ -26,3 +27,60 @@ def test_division(division):
     assert division.calculate(8, 2) == 4
     assert division.calculate(-9, 3) == -3
     assert division.calculate(7.5, 2.5) == 3.0
+
+def test_multiplication_with_string(multiplication):
+    with pytest.raises(TypeError, match="Both arguments must be numbers"):
+        multiplication.calculate(2, "3")
+
+def test_division_by_zero(division):
+    with pytest.raises(ValueError, match="The divisor cannot be zero"):
+        division.calculate(1, 0)
+
+##############################
+# Batch Testcases
+##############################
+@pytest.fixture(scope="function", params=["python", "numpy"])
+def backend(request, monkeypatch):
+    import main
+
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(main, "np", None)
+    return request.param
+
+def test_multiplication_many(backend, multiplication):
+    results, mask = multiplication.calculate_many([3, -2, 0, 2.5], [4, 5, 100, 4])
+    assert list(results) == [12, -10, 0, 10.0]
+    assert not any(mask)
+
+def test_division_many(backend, division):
+    results, mask = division.calculate_many([8, -9, 7.5, 1], [2, 3, 2.5, 0])
+    assert list(results)[:3] == [4, -3, 3.0]
+    assert math.isnan(results[3])
+    assert list(mask) == [False, False, False, True]
+
+def test_calculate_many_with_string(backend, multiplication):
+    with pytest.raises(TypeError, match="Both arguments must be numbers"):
+        multiplication.calculate_many([1, 2], [3, "4"])
+
+def test_calculate_many_with_different_lengths(backend, division):
+    with pytest.raises(ValueError, match="same length"):
+        division.calculate_many([1, 2], [3])
+
+def test_multiplication_many_beyond_int64(backend, multiplication):
+    """
+    The testcase is to test that products and operands beyond the int64
+    range are exact, like calculate().
+    """
+
+    results, mask = multiplication.calculate_many([2**40, 3, 2**70], [2**40, 4, 3])
+    assert [int(x) for x in results] == [2**80, 12, 3 * 2**70]
+    assert results[0] == multiplication.calculate(2**40, 2**40)
+    assert not any(mask)
+
+def test_division_many_beyond_int64(backend, division):
+    results, mask = division.calculate_many([2**70, 1], [2**10, 0])
+    assert results[0] == 2**60
+    assert math.isnan(results[1])
+    assert list(mask) == [False, True]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+def discover(root: Path) -> list[Path]:
+    """
+    Find every pytest suite under root.
+
+    A suite is a directory with a pyproject.toml that configures pytest and
+    a tests/ directory next to it.
+    """
+
+    suites = []
+    for pyproject in sorted(root.glob("lesson-*/*/pyproject.toml")):
+        config = pyproject.read_text()
+        if "[tool.pytest" in config and (pyproject.parent / "tests").is_dir():
+            suites.append(pyproject.parent)
+    return suites
+
+def run_suite(suite: Path, root: Path, workdir: Path) -> dict:
+    """
+    Run one suite in its own interpreter.
+
+    The working directory is the suite itself, so pytest picks up its
+    pyproject.toml and `pythonpath`, and modules named `main` never clash.
+    """
+
+    name = str(suite.relative_to(root))
+    junit = workdir / (name.replace(os.sep, "_") + ".xml")
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "--junitxml", str(junit)],
+        cwd=suite,
+        capture_output=True,
+        text=True,
+    )
+    duration = time.perf_counter() - start
+
+    return {
+        "suite": name,
+        "returncode": process.returncode,
+        "duration": round(duration, 3),
+        "junit": junit if junit.is_file() else None,
+        "output": process.stdout + process.stderr,
+    }
+
+def merge_junit(results: list[dict], path: Path):
+    """Merge the JUnit reports of all suites into one <testsuites> document."""
+    merged = ET.Element("testsuites")
+    for result in results:
+        if result["junit"] is None:
+            continue
+        tree = ET.parse(result["junit"])
+        node = tree.getroot()
+        for testsuite in ([node] if node.tag == "testsuite" else node.iter("testsuite")):
+            testsuite.set("name", result["suite"])
+            merged.append(testsuite)
+    ET.ElementTree(merged).write(path, encoding="utf-8", xml_declaration=True)
+
+def schedule(suites: list[Path], root: Path, previous: Path | None) -> list[Path]:
+    """Order suites longest first, using the durations of a previous report."""
+    if previous is None or not previous.is_file():
+        return suites
+    durations = {r["suite"]: r["duration"] for r in json.loads(previous.read_text())["suites"]}
+    return sorted(suites, key=lambda s: durations.get(str(s.relative_to(root)), 0), reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run every lesson test suite in an isolated subprocess, in parallel."
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of suites to run at once (default: CPU count).")
+    parser.add_argument("--root", type=Path, default=Path(__file__).resolve().parents[2], help="Repository root.")
+    parser.add_argument("--junit", type=Path, default=Path("report.xml"), help="Merged JUnit report (default: report.xml).")
+    parser.add_argument("--json", type=Path, default=Path("report.json"), help="JSON summary, also used to order the next run (default: report.json).")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print the output of failed suites.")
+    args = parser.parse_args()
+
+    root = args.root.resolve()
+    suites = schedule(discover(root), root, args.json)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as workdir:
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(lambda s: run_suite(s, root, Path(workdir)), suites))
+        merge_junit(results, args.junit)
+    wall = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["suite"])
+    print("{:20} {:>8}  {}".format("suite", "seconds", "status"))
+    for result in results:
+        status = "passed" if result["returncode"] == 0 else "failed ({})".format(result["returncode"])
+        print("{:20} {:>8.2f}  {}".format(result["suite"], result["duration"], status))
+        if args.verbose and result["returncode"] != 0:
+            print(result["output"])
+
+    total = sum(r["duration"] for r in results)
+    print("\n{} suites, {} jobs: wall {:.2f} s, sum of suites {:.2f} s".format(len(results), args.jobs, wall, total))
+
+    summary = {
+        "wall": round(wall, 3),
+        "jobs": args.jobs,
+        "suites": [{k: v for k, v in r.items() if k not in ("junit", "output")} for r in results],
+    }
+    args.json.write_text(json.dumps(summary, indent=2) + "\n")
+
+    sys.exit(0 if all(r["returncode"] == 0 for r in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Compare 1,000 sequential `animal dog` invocations with and without `animal serve`
+
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import time
+
+COUNT = 1000
+COMMAND = [shutil.which("animal") or "animal", "dog", "--name=Maru", "--kind=Shiba"]
+
+def measure(env: dict) -> float:
+    start = time.perf_counter()
+    for _ in range(COUNT):
+        subprocess.run(COMMAND, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, ANIMAL_SOCKET=str(Path(workdir) / "animal.sock"))
+
+        elapsed = measure(env)
+        print(f"in-process : {elapsed:.2f} s, {elapsed / COUNT * 1000:.1f} ms per invocation")
+
+        daemon = subprocess.Popen([COMMAND[0], "serve"], env=env, stderr=subprocess.DEVNULL)
+        while not Path(env["ANIMAL_SOCKET"]).exists():
+            time.sleep(0.05)
+        try:
+            elapsed = measure(env)
+            print(f"daemon     : {elapsed:.2f} s, {elapsed / COUNT * 1000:.1f} ms per invocation")
+        finally:
+            daemon.terminate()
+            daemon.wait()
@@ -1,3 +1,18 @@
-from .mammalia import Dog
+import importlib
 
 __all__ = ["Dog"]
+
+# exported name -> module, imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    "Dog": ".mammalia",
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
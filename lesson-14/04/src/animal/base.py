@@ -1,11 +1,15 @@
+# flyweight table: one shared string object per distinct kind
+KINDS: dict[str, str] = {}
+
 class Animal():
+    __slots__ = ("__kind", "name", "legs")
 
     def __init__(self, kind: str, name: str, legs: int):
         """
         The first step when creating a new object
         """
 
-        self.__kind = kind
+        self.__kind = KINDS.setdefault(kind, kind)
         self.name = name
         self.legs = legs
 
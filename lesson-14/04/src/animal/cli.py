@@ -3,27 +3,46 @@
 """
 Usage:
     animal dog --name=<name> --kind=<kind>
+    animal batch [<file>] [--format=<format>]
+    animal serve [--socket=<path>]
 
 options:
     -h, --help          Show this help message.
     --name=<name>       Name of the dog.
     --kind=<kind>       Kind/Breed of the dog.
+    --format=<format>   Format of the records: jsonl or csv.
+    --socket=<path>     Unix socket of the daemon.
 """
 
+import importlib
 import rich_click as click
-from animal.mammalia import Dog
 
-@click.group()
+class LazyGroup(click.RichGroup):
+    """
+    A group that imports a subcommand module only when the command is used.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> "module:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module, attribute = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module), attribute)
+        return super().get_command(ctx, cmd_name)
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "batch": "animal.commands.batch:batch",
+    "dog": "animal.commands.dog:dog",
+    "serve": "animal.commands.serve:serve",
+})
 def cli():
     pass
 
-@cli.command()
-@click.option("--name", required=True, help="Name of the dog.")
-@click.option("--kind", required=True, help="Kind/Breed of the dog.")
-def dog(name: str, kind: str):
-    instance = Dog(name=name, kind=kind)
-    instance.hello()
-    instance.run()
-
 if __name__ == "__main__":
     cli()
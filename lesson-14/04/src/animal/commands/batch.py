@@ -0,0 +1,92 @@
+import contextlib
+import csv
+import io
+import json
+import sys
+import rich_click as click
+
+# the fields of a record, in the order Dog() takes them
+FIELDS = ("name", "kind")
+
+def read_records(stream, format_: str):
+    """
+    Yield (line number, record) pairs from a JSONL or CSV stream.
+
+    A CSV record is a dict, a JSONL record is the text of its line, which
+    dog_fields() parses. A CSV header without the FIELDS fails before any
+    record is read.
+    """
+    if format_ == "csv":
+        reader = csv.DictReader(stream)
+        missing = [field for field in FIELDS if field not in (reader.fieldnames or ())]
+        if missing:
+            raise click.ClickException("the CSV header needs the columns {}, missing {}".format(
+                ",".join(FIELDS), ",".join(missing)))
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_num, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_num, line
+
+def dog_fields(record: dict | str) -> tuple[str, str]:
+    """The name and kind of a record, ValueError when it has none."""
+    if isinstance(record, str):
+        try:
+            record = json.loads(record)
+        except json.JSONDecodeError as e:
+            raise ValueError(str(e)) from None
+    # a short CSV row has None for the missing columns
+    if not isinstance(record, dict) or not all(isinstance(record.get(f), str) and record[f] for f in FIELDS):
+        raise ValueError("a record needs a name and a kind")
+    return record["name"], record["kind"]
+
+@click.command()
+@click.argument("file", type=click.File("r"), default="-")
+@click.option("--format", "format_", type=click.Choice(["jsonl", "csv"]), default=None,
+              help="Format of the records (default: from the file extension, jsonl for stdin).")
+@click.option("--buffer-size", type=int, default=10000, show_default=True,
+              help="Number of records whose output is written at once.")
+def batch(file, format_: str | None, buffer_size: int):
+    """
+    Create a dog for every record of FILE (or stdin) in one process.
+
+    An invalid record is reported on stderr with its line number and
+    skipped, the other records are still handled. The exit status is 1
+    when any record failed.
+    """
+    from animal.mammalia import Dog
+
+    if format_ is None:
+        format_ = "csv" if file.name.endswith(".csv") else "jsonl"
+
+    out = sys.stdout
+    buffer = io.StringIO()
+    pending = 0
+    total = 0
+    failed = 0
+    with contextlib.redirect_stdout(buffer):
+        for line_num, record in read_records(file, format_):
+            total += 1
+            try:
+                name, kind = dog_fields(record)
+            except ValueError as e:
+                failed += 1
+                click.echo(f"line {line_num}: {e}", err=True)
+                continue
+            instance = Dog(name=name, kind=kind)
+            instance.hello()
+            instance.run()
+
+            pending += 1
+            if pending >= buffer_size:
+                out.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+    out.write(buffer.getvalue())
+    out.flush()
+    if failed:
+        raise click.ClickException(f"{failed} of {total} records failed")
@@ -0,0 +1,12 @@
+import rich_click as click
+
+@click.command()
+@click.option("--name", required=True, help="Name of the dog.")
+@click.option("--kind", required=True, help="Kind/Breed of the dog.")
+def dog(name: str, kind: str):
+    """Create a dog and let it introduce itself."""
+    from animal.mammalia import Dog
+
+    instance = Dog(name=name, kind=kind)
+    instance.hello()
+    instance.run()
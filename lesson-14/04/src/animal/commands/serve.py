@@ -0,0 +1,17 @@
+from pathlib import Path
+import rich_click as click
+
+@click.command()
+@click.option("--socket", "path", type=click.Path(path_type=Path), default=None,
+              help="Unix socket to listen on (default: $ANIMAL_SOCKET or a per-user socket).")
+def serve(path: Path | None):
+    """Keep a warm interpreter that runs forwarded animal commands."""
+    from animal.daemon import serve as serve_forever
+    from animal.daemon import socket_path
+
+    path = path or socket_path()
+    click.echo(f"Listening on {path}, press Ctrl+C to stop.", err=True)
+    try:
+        serve_forever(path)
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from None
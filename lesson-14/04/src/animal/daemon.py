@@ -0,0 +1,147 @@
+"""
+Forward `animal` invocations to a resident interpreter over a Unix socket.
+
+This module is the console entry point, so it only imports what is needed to
+talk to the daemon. The CLI itself is imported when the daemon is not running.
+"""
+
+import json
+import os
+from pathlib import Path
+import socket
+import stat
+import sys
+
+# commands that always run in the calling process
+LOCAL_COMMANDS = {"serve", "batch"}
+
+def socket_path() -> Path:
+    """
+    Path of the daemon socket, ANIMAL_SOCKET overrides the default.
+
+    The default is in XDG_RUNTIME_DIR, which only the user can access, or
+    else in a directory animal-<uid> of the temporary directory, which
+    serve() creates with mode 0700.
+    """
+    if "ANIMAL_SOCKET" in os.environ:
+        return Path(os.environ["ANIMAL_SOCKET"])
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "animal.sock"
+    return Path(os.environ.get("TMPDIR") or "/tmp") / "animal-{}".format(os.getuid()) / "animal.sock"
+
+def _owned(path: Path) -> bool:
+    """True when path is a socket that belongs to the current user."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+def _peer_is_owner(sock: socket.socket) -> bool:
+    """True when the process at the other end runs as the current user, where the OS tells."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    # struct ucred: pid, uid, gid
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, 12)
+    return int.from_bytes(credentials[4:8], sys.byteorder) == os.getuid()
+
+def forward(argv: list[str], path: Path) -> dict | None:
+    """
+    Run argv on the daemon listening at path.
+
+    Returns the response (stdout, stderr and exit_code), or None when no
+    daemon is running. A daemon that closes the connection or answers
+    garbage, e.g. because it died, counts as not running, so the caller
+    runs the command itself.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            # a socket of another user could be an impostor, and the peer
+            # check also covers a path replaced after this one
+            if not _owned(path):
+                return None
+            sock.connect(str(path))
+            if not _peer_is_owner(sock):
+                return None
+            sock.sendall(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+        # OSError: no socket, refused or reset; ValueError: empty or invalid JSON
+        except (OSError, ValueError):
+            return None
+
+    if not isinstance(response, dict) or not {"stdout", "stderr", "exit_code"} <= response.keys():
+        return None
+    return response
+
+def serve(path: Path):
+    """Answer forwarded invocations, one at a time, until interrupted."""
+    import signal
+    import socketserver
+    from click.testing import CliRunner
+    from animal.cli import cli
+
+    runner = CliRunner()
+
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            result = runner.invoke(cli, request["argv"], prog_name="animal")
+            response = {
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "exit_code": result.exit_code,
+            }
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    directory = path.parent
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = directory.lstat()
+    # a directory others can write to lets them replace the socket, unless it is sticky like /tmp
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid not in (os.getuid(), 0) or (
+            st.st_mode & 0o022 and not st.st_mode & stat.S_ISVTX):
+        raise RuntimeError("{} must be a directory of the current user that others cannot write to".format(directory))
+
+    if path.exists() or path.is_symlink():
+        if forward(["--help"], path) is not None:
+            raise RuntimeError("A daemon is already listening on {}".format(path))
+        path.unlink()
+
+    # stop cleanly on SIGTERM as well as Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # the socket is created by bind(), with permissions from the umask
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(umask)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+def main():
+    argv = sys.argv[1:]
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command not in LOCAL_COMMANDS:
+        response = forward(argv, socket_path())
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            sys.exit(response["exit_code"])
+
+    from animal.cli import cli
+    cli(prog_name="animal")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from typing import override
 from .base import Animal
 
 class Dog(Animal):
+    __slots__ = ()
+
     def __init__(self, kind: str, name: str):
         super().__init__(kind, name, 4)
 
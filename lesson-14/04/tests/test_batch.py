@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+from click.testing import CliRunner
+from animal.cli import cli
+
+##############################
+# Testcases
+##############################
+def test_batch_jsonl():
+    records = '{"name": "Maru", "kind": "Shiba"}\n\n{"name": "Hachi", "kind": "Akita"}\n'
+    result = CliRunner().invoke(cli, ["batch", "--buffer-size", "1"], input=records)
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "My name is Maru. I am Shiba.\nI can run by 4 legs\n"
+        "My name is Hachi. I am Akita.\nI can run by 4 legs\n"
+    )
+
+def test_batch_csv(tmp_path):
+    path = tmp_path / "dogs.csv"
+    path.write_text("name,kind\nMaru,Shiba\n")
+    result = CliRunner().invoke(cli, ["batch", str(path)])
+    assert result.exit_code == 0, result.output
+    assert result.output == "My name is Maru. I am Shiba.\nI can run by 4 legs\n"
+
+def test_batch_invalid_record():
+    result = CliRunner().invoke(cli, ["batch"], input='{"name": "Maru"}\n')
+    assert result.exit_code != 0
+    assert "line 1" in result.output
+
+def test_batch_keeps_output_of_valid_records():
+    """
+    The testcase is to test that an invalid record in the middle is reported
+    with its line number, and the records around it are still handled.
+    """
+
+    records = '{"name": "Maru", "kind": "Shiba"}\n{"name": "Pochi"}\nnot json\n{"name": "Hachi", "kind": "Akita"}\n'
+    result = CliRunner().invoke(cli, ["batch", "--buffer-size", "1"], input=records)
+    assert result.exit_code == 1
+    assert result.stdout == (
+        "My name is Maru. I am Shiba.\nI can run by 4 legs\n"
+        "My name is Hachi. I am Akita.\nI can run by 4 legs\n"
+    )
+    assert "line 2: a record needs a name and a kind" in result.stderr
+    assert "line 3: " in result.stderr
+    assert "2 of 4 records failed" in result.stderr
+
+def test_batch_csv_short_row(tmp_path):
+    path = tmp_path / "dogs.csv"
+    path.write_text("name,kind\nMaru\nHachi,Akita\n")
+    result = CliRunner().invoke(cli, ["batch", str(path)])
+    assert result.exit_code == 1
+    assert result.stdout == "My name is Hachi. I am Akita.\nI can run by 4 legs\n"
+    assert "line 2: a record needs a name and a kind" in result.stderr
+
+def test_batch_csv_missing_column(tmp_path):
+    path = tmp_path / "dogs.csv"
+    path.write_text("name,breed\nMaru,Shiba\n")
+    result = CliRunner().invoke(cli, ["batch", str(path)])
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "missing kind" in result.stderr
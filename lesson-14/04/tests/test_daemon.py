@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+import threading
+import time
+import pytest
+from animal.daemon import forward
+from animal.daemon import serve
+from animal.daemon import socket_path
+
+##############################
+# Fixtures
+##############################
+@pytest.fixture(scope="module")
+def daemon(tmp_path_factory):
+    """Run `animal serve` in a subprocess and yield its socket path."""
+    path = tmp_path_factory.mktemp("daemon") / "animal.sock"
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).parents[1] / "src"))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "animal.daemon", "serve", "--socket", str(path)],
+        env=env, stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + 10
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    yield path
+
+    process.terminate()
+    process.wait(timeout=10)
+    assert not path.exists()
+
+@pytest.fixture(scope="function")
+def broken_daemon(tmp_path, request):
+    """Listen on a socket and answer each connection with request.param, then close it."""
+    path = tmp_path / "broken.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+
+    def answer():
+        connection, _ = server.accept()
+        with connection:
+            connection.recv(4096)
+            connection.sendall(request.param)
+
+    thread = threading.Thread(target=answer, daemon=True)
+    thread.start()
+    yield path
+    thread.join(timeout=10)
+    server.close()
+
+##############################
+# Testcases
+##############################
+def test_forward_without_daemon(tmp_path):
+    assert forward(["dog", "--name=Maru", "--kind=Shiba"], tmp_path / "missing.sock") is None
+
+def test_forward(daemon):
+    response = forward(["dog", "--name=Maru", "--kind=Shiba"], daemon)
+    assert response["exit_code"] == 0
+    assert response["stdout"] == "My name is Maru. I am Shiba.\nI can run by 4 legs\n"
+
+def test_forward_error(daemon):
+    response = forward(["dog", "--name=Maru"], daemon)
+    assert response["exit_code"] == 2
+    assert "--kind" in response["stderr"]
+
+@pytest.mark.parametrize("broken_daemon", [b"", b"not json\n", b"[]\n"], indirect=True)
+def test_forward_broken_reply(broken_daemon):
+    """
+    The testcase is to test that a daemon that dies before answering, or
+    answers garbage, counts as no daemon, so the command runs locally.
+    """
+
+    assert forward(["dog", "--name=Maru", "--kind=Shiba"], broken_daemon) is None
+
+def test_socket_is_private(daemon):
+    assert daemon.stat().st_mode & 0o777 == 0o600
+
+def test_forward_to_regular_file(tmp_path):
+    path = tmp_path / "file.sock"
+    path.write_text("")
+    assert forward(["dog", "--name=Maru", "--kind=Shiba"], path) is None
+
+def test_default_socket_in_private_directory(monkeypatch, tmp_path):
+    """
+    The testcase is to test that without XDG_RUNTIME_DIR the default socket
+    is in a per-user directory, not directly in the shared temporary one.
+    """
+
+    monkeypatch.delenv("ANIMAL_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    assert socket_path() == tmp_path / "animal-{}".format(os.getuid()) / "animal.sock"
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    assert socket_path() == tmp_path / "run" / "animal.sock"
+
+def test_serve_refuses_shared_directory(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+    with pytest.raises(RuntimeError, match="others cannot write to"):
+        serve(directory / "animal.sock")
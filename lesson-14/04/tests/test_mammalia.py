@@ -9,3 +9,9 @@ def test_dog():
     puppy = Dog(kind="Shiba", name="Maru")
     puppy.hello()
     puppy.run()
+
+def test_dog_is_slotted():
+    puppy = Dog(kind="".join(["Shi", "ba"]), name="Maru")
+    other = Dog(kind="".join(["Shi", "ba"]), name="Hachi")
+    assert not hasattr(puppy, "__dict__")
+    assert puppy._Animal__kind is other._Animal__kind
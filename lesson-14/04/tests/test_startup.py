@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+# startup budget for importing the CLI, override with ANIMAL_IMPORT_BUDGET_MS
+BUDGET_MS = float(os.environ.get("ANIMAL_IMPORT_BUDGET_MS", "300"))
+
+##############################
+# Functions
+##############################
+def import_time(statement: str) -> dict[str, int]:
+    """
+    Run a statement with `python -X importtime` in a fresh interpreter.
+
+    Returns the cumulative import time in microseconds of every module.
+    """
+
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).parents[1] / "src"))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True, env=env,
+    )
+
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+##############################
+# Testcases
+##############################
+def test_package_import_is_lazy():
+    modules = import_time("import animal")
+    assert "animal.mammalia" not in modules
+
+def test_cli_import_is_lazy():
+    modules = import_time("import animal.cli")
+    assert "animal.mammalia" not in modules
+    assert "animal.commands.dog" not in modules
+
+def test_cli_import_budget():
+    modules = import_time("import animal.cli")
+    assert modules["animal.cli"] / 1000 < BUDGET_MS
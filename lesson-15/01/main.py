@@ -1,12 +1,55 @@
 #!/usr/bin/env python3
 
 from urllib import request
+import zlib
+
+CHUNK_SIZE = 64 * 1024
 
 def fetch_url(url: str) -> str:
     with request.urlopen(url) as response:
         return response.read().decode("utf-8")
 
+def fetch_stream(url: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield the body of url in chunks of at most chunk_size bytes.
+
+    gzip and deflate bodies are decompressed as they arrive, so memory
+    stays flat however large the response is.
+    """
+
+    req = request.Request(url, headers={"Accept-Encoding": "gzip, deflate"})
+    with request.urlopen(req) as response:
+        encoding = response.headers.get("Content-Encoding", "identity").lower()
+        if encoding == "identity":
+            while chunk := response.read(chunk_size):
+                yield chunk
+            return
+        if encoding not in ("gzip", "deflate"):
+            raise ValueError("Unsupported Content-Encoding: {}".format(encoding))
+
+        # 32 + MAX_WBITS detects both the gzip and the zlib header
+        decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        while chunk := response.read(chunk_size):
+            # max_length bounds the output of a highly compressed chunk
+            data = decompressor.decompress(chunk, chunk_size)
+            while data:
+                yield data
+                data = decompressor.decompress(decompressor.unconsumed_tail, chunk_size)
+        if tail := decompressor.flush():
+            yield tail
+
+def fetch_to_file(url: str, path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """Stream url into the file at path, returns the number of bytes written."""
+    size = 0
+    with open(path, "wb", buffering=chunk_size) as file:
+        for chunk in fetch_stream(url, chunk_size):
+            size += file.write(chunk)
+    return size
+
 if __name__ == "__main__":
     url = "http://www.google.com"
     content = fetch_url(url)
     print(content)
+
+    size = fetch_to_file(url, "google.html")
+    print("Saved {} bytes to google.html".format(size))
@@ -1,15 +1,52 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+CHUNK_SIZE = 64 * 1024
+
+# one shared session keeps connections alive between calls
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_maxsize=10,
+    # after the last retry, return the 5xx response instead of raising RetryError
+    max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+session.mount("http://", adapter)
+session.mount("https://", adapter)
 
 def fetch_url(url: str) -> str:
-    response = requests.get(url)
+    response = session.get(url)
     response.raise_for_status()
     if response.status_code != 200:
         raise Exception("Failed to fetch URL: {}".format(url))
     return response.text
 
+def fetch_stream(url: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield the body of url in chunks of at most chunk_size bytes.
+
+    iter_content() decompresses gzip and deflate bodies as they arrive, so
+    memory stays flat however large the response is.
+    """
+
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size)
+
+def fetch_to_file(url: str, path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """Stream url into the file at path, returns the number of bytes written."""
+    size = 0
+    with open(path, "wb", buffering=chunk_size) as file:
+        for chunk in fetch_stream(url, chunk_size):
+            size += file.write(chunk)
+    return size
+
 if __name__ == "__main__":
     url = "http://www.google.com"
     content = fetch_url(url)
     print(content)
+
+    size = fetch_to_file(url, "google.html")
+    print("Saved {} bytes to google.html".format(size))
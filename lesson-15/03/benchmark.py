@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Compare a new connection per request with the pooled keep-alive client
+
+import time
+from urllib import request
+from client import HTTPClient
+from server import StandInServer
+
+COUNT = 2000
+
+def measure(name: str, fetch, url: str):
+    start = time.perf_counter()
+    for i in range(COUNT):
+        fetch("{}/item/{}".format(url, i))
+    elapsed = time.perf_counter() - start
+    print("{:24} {:8.0f} requests/s".format(name, COUNT / elapsed))
+
+def urlopen(url: str) -> bytes:
+    with request.urlopen(url) as response:
+        return response.read()
+
+if __name__ == "__main__":
+    with StandInServer() as server:
+        print("GET {} times from {}".format(COUNT, server.url))
+        measure("urlopen", urlopen, server.url)
+        measure("HTTPClient", HTTPClient().get, server.url)
+
+        try:
+            import requests
+        except ImportError:
+            requests = None
+
+        if requests is not None:
+            measure("requests.get", requests.get, server.url)
+            measure("requests.Session", requests.Session().get, server.url)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Fetch the same pages repeatedly without a cache, with revalidation (304) and with max-age
+
+import tempfile
+import time
+from cache import HTTPCache
+from client import HTTPClient
+from server import ConditionalHandler
+from server import StandInServer
+
+PAGES = 50
+ROUNDS = 10
+
+def measure(name: str, client: HTTPClient, handler, url: str):
+    handler.bytes_sent = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for i in range(PAGES):
+            response = client.get("{}/page/{}".format(url, i))
+            assert response.status == 200 and len(response.body) == handler.body_size
+    elapsed = time.perf_counter() - start
+    print("{:24} {:8.2f} ms/request {:10.0f} KiB sent".format(
+        name, elapsed * 1000 / (PAGES * ROUNDS), handler.bytes_sent / 1024))
+
+if __name__ == "__main__":
+    for max_age in (0, 60):
+        handler = type("Handler", (ConditionalHandler,), {"max_age": max_age, "body_size": 256 * 1024})
+        with StandInServer(handler) as server, tempfile.TemporaryDirectory() as directory:
+            print("\nGET {} pages {} times from {} (max-age={})".format(PAGES, ROUNDS, server.url, max_age))
+            measure("no cache", HTTPClient(), handler, server.url)
+            measure("cache", HTTPClient(cache=HTTPCache(directory)), handler, server.url)
+
+    # a cache smaller than the working set keeps evicting
+    handler = type("Handler", (ConditionalHandler,), {"max_age": 60, "body_size": 256 * 1024})
+    with StandInServer(handler) as server, tempfile.TemporaryDirectory() as directory:
+        cache = HTTPCache(directory, max_bytes=PAGES // 2 * handler.body_size)
+        print("\nCache of {} KiB for {} KiB of pages".format(cache.max_bytes // 1024, PAGES * handler.body_size // 1024))
+        measure("cache (LRU evicting)", HTTPClient(cache=cache), handler, server.url)
+        assert cache.size <= cache.max_bytes
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Peak memory of reading a whole body vs. streaming it, with the urllib and requests clients
+
+import importlib.util
+import os
+from pathlib import Path
+import tempfile
+import time
+import tracemalloc
+from server import StandInServer
+from server import StreamingHandler
+
+MEGABYTES = 100
+
+def load(name: str, path: Path):
+    # 01/main.py and 02/main.py are both named main
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(name: str, function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:32} {:6.2f} s {:10.1f} MiB peak".format(name, elapsed, peak / 1024 / 1024))
+
+def consume(fetch_stream, url: str):
+    size = sum(len(chunk) for chunk in fetch_stream(url))
+    assert size == MEGABYTES * 1024 * 1024, size
+
+if __name__ == "__main__":
+    here = Path(__file__).resolve().parent
+    clients = {"urllib": load("urllib_main", here.parent / "01" / "main.py")}
+    try:
+        clients["requests"] = load("requests_main", here.parent / "02" / "main.py")
+    except ImportError:
+        pass
+
+    with StandInServer(StreamingHandler) as server, tempfile.TemporaryDirectory() as directory:
+        url = "{}/{}".format(server.url, MEGABYTES)
+        path = os.path.join(directory, "body.txt")
+        print("GET {} MiB from {}".format(MEGABYTES, server.url))
+
+        for name, client in clients.items():
+            measure("{} fetch_url".format(name), client.fetch_url, url)
+            measure("{} fetch_stream (gzip)".format(name), consume, client.fetch_stream, url)
+            measure("{} fetch_to_file (gzip)".format(name), client.fetch_to_file, url, path)
+            assert os.path.getsize(path) == MEGABYTES * 1024 * 1024
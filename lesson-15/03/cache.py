@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import http.client
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+def cache_control(headers: http.client.HTTPMessage) -> dict[str, str]:
+    """Parse Cache-Control into {directive: value}, value is "" without one."""
+    directives = {}
+    for item in ",".join(headers.get_all("Cache-Control") or []).split(","):
+        name, _, value = item.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+@dataclass
+class CacheEntry:
+    url: str
+    headers: list[tuple[str, str]]
+    stored_at: float
+    max_age: int
+    size: int
+
+    def fresh(self) -> bool:
+        return time.time() < self.stored_at + self.max_age
+
+    def message(self) -> http.client.HTTPMessage:
+        message = http.client.HTTPMessage()
+        for key, value in self.headers:
+            message[key] = value
+        return message
+
+    def validators(self) -> dict[str, str]:
+        """Headers that ask the server to answer 304 if the body is unchanged."""
+        headers = {}
+        for key, value in self.headers:
+            if key.lower() == "etag":
+                headers["If-None-Match"] = value
+            elif key.lower() == "last-modified":
+                headers["If-Modified-Since"] = value
+        return headers
+
+class HTTPCache:
+
+    def __init__(self, directory: Path, max_bytes: int = 100 * 1024 * 1024):
+        """
+        On-disk HTTP cache keyed by URL.
+
+        Every entry is a body file and a `.json` sidecar with the headers.
+        When the bodies exceed max_bytes, the least recently used entries
+        are removed first. The directory is created readable by its owner
+        only. Responses are assumed to be requested with the same headers,
+        so responses that vary on anything else (`Vary: *`) are not stored.
+        """
+
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        # least recently used first, the mtime of a sidecar is its last use
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        for meta_path in sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime):
+            self._sizes[meta_path.stem] = json.loads(meta_path.read_text())["size"]
+
+    @property
+    def size(self) -> int:
+        return sum(self._sizes.values())
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / key, self.directory / (key + ".json")
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        _, meta_path = self._paths(key)
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            try:
+                os.utime(meta_path)
+                entry = CacheEntry(**json.loads(meta_path.read_text()))
+            except FileNotFoundError:
+                # evicted by another process sharing the directory
+                del self._sizes[key]
+                return None
+            self._sizes.move_to_end(key)
+            return entry
+
+    def body(self, entry: CacheEntry) -> bytes:
+        body_path, _ = self._paths(hashlib.sha256(entry.url.encode("utf-8")).hexdigest())
+        return body_path.read_bytes()
+
+    def store(self, url: str, headers: http.client.HTTPMessage, body: bytes | None = None) -> CacheEntry | None:
+        """
+        Save a 200 response, or refresh the headers of an entry after a 304
+        when body is None. Returns None if the response must not be cached.
+        """
+
+        directives = cache_control(headers)
+        if "no-store" in directives or (body is not None and len(body) > self.max_bytes):
+            return None
+        if "*" in (name.strip() for name in ",".join(headers.get_all("Vary") or []).split(",")):
+            return None
+
+        max_age = 0
+        if "no-cache" not in directives and directives.get("max-age", "").isdigit():
+            max_age = int(directives["max-age"])
+        if not max_age and "ETag" not in headers and "Last-Modified" not in headers:
+            # never fresh and cannot be revalidated, nothing to gain
+            return None
+
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        body_path, meta_path = self._paths(key)
+        with self._lock:
+            if body is None:
+                old = CacheEntry(**json.loads(meta_path.read_text()))
+                merged = dict(old.message().items())
+                merged.update(headers.items())
+                entry = CacheEntry(url, list(merged.items()), time.time(), max_age, old.size)
+            else:
+                entry = CacheEntry(url, list(headers.items()), time.time(), max_age, len(body))
+                body_path.with_suffix(".tmp").write_bytes(body)
+                os.replace(body_path.with_suffix(".tmp"), body_path)
+
+            meta_path.write_text(json.dumps(entry.__dict__))
+            self._sizes[key] = entry.size
+            self._sizes.move_to_end(key)
+            self._evict()
+        return entry
+
+    def _evict(self):
+        total = self.size
+        while total > self.max_bytes:
+            key, size = self._sizes.popitem(last=False)
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for key in self._sizes:
+                for path in self._paths(key):
+                    path.unlink(missing_ok=True)
+            self._sizes.clear()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass
+import http.client
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+from cache import HTTPCache
+
+# failures worth another attempt on a fresh connection
+RETRY_EXCEPTIONS = (http.client.HTTPException, ConnectionError, TimeoutError)
+RETRY_STATUS = {502, 503, 504}
+
+class HTTPError(Exception):
+    pass
+
+@dataclass
+class Response:
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+    from_cache: bool = False
+
+    def text(self) -> str:
+        charset = self.headers.get_content_charset() or "utf-8"
+        return self.body.decode(charset)
+
+class HTTPClient:
+
+    def __init__(self, pool_size: int = 10, retries: int = 3, backoff: float = 0.1, timeout: float = 10.0,
+                 cache: HTTPCache | None = None):
+        """
+        HTTP client that keeps connections alive in a pool per host.
+
+        pool_size is the number of idle connections kept per host, and a
+        failed GET is retried up to `retries` times, waiting
+        backoff * 2 ** attempt seconds in between. With a cache, fresh
+        responses are served from disk and stale ones are revalidated.
+        """
+
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self._pools: dict[tuple[str, str, int | None], queue.LifoQueue] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, key) -> queue.LifoQueue:
+        pool = self._pools.get(key)
+        if pool is None:
+            # created once per host, under the lock so two threads never get different pools
+            with self._pools_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = queue.LifoQueue(maxsize=self.pool_size)
+        return pool
+
+    def _acquire(self, key) -> http.client.HTTPConnection:
+        try:
+            return self._pool(key).get_nowait()
+        except queue.Empty:
+            scheme, host, port = key
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _release(self, key, connection: http.client.HTTPConnection):
+        try:
+            self._pool(key).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def get(self, url: str, headers: dict | None = None) -> Response:
+        # entries are keyed by URL, which is only sound when every request
+        # sends the same headers, so requests with custom headers bypass the cache
+        if self.cache is None or headers:
+            return self._get(url, headers)
+
+        entry = self.cache.lookup(url)
+        request_headers = headers
+        if entry is not None:
+            if entry.fresh():
+                try:
+                    return Response(200, entry.message(), self.cache.body(entry), from_cache=True)
+                except FileNotFoundError:
+                    # evicted by another thread in the meantime
+                    entry = None
+            else:
+                request_headers = {**(headers or {}), **entry.validators()}
+
+        response = self._get(url, request_headers)
+        if response.status == 304 and entry is not None:
+            try:
+                entry = self.cache.store(url, response.headers) or entry
+                return Response(200, entry.message(), self.cache.body(entry), from_cache=True)
+            except FileNotFoundError:
+                response = self._get(url, headers)
+
+        if response.status == 200:
+            self.cache.store(url, response.headers, response.body)
+        return response
+
+    def _get(self, url: str, headers: dict | None = None) -> Response:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+
+        for attempt in range(self.retries + 1):
+            connection = self._acquire(key)
+            try:
+                connection.request("GET", target, headers=headers or {})
+                response = connection.getresponse()
+                body = response.read()
+            except RETRY_EXCEPTIONS:
+                connection.close()
+                if attempt == self.retries:
+                    raise
+            else:
+                if response.will_close:
+                    connection.close()
+                else:
+                    self._release(key, connection)
+                if response.status not in RETRY_STATUS or attempt == self.retries:
+                    return Response(response.status, response.headers, body)
+            time.sleep(self.backoff * 2 ** attempt)
+
+    def close(self):
+        for pool in self._pools.values():
+            while not pool.empty():
+                pool.get_nowait().close()
+
+# shared by every call to fetch_url(), caching is opt-in with HTTP_CACHE_DIR
+client = HTTPClient(cache=HTTPCache(Path(os.environ["HTTP_CACHE_DIR"])) if os.environ.get("HTTP_CACHE_DIR") else None)
+
+def fetch_url(url: str) -> str:
+    response = client.get(url)
+    if response.status != 200:
+        raise HTTPError("Failed to fetch URL: {} ({})".format(url, response.status))
+    return response.text()
+
+if __name__ == "__main__":
+    url = "http://www.google.com"
+    content = fetch_url(url)
+    print(content)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+from email.utils import formatdate
+from email.utils import parsedate_to_datetime
+import hashlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import threading
+import zlib
+
+class Handler(BaseHTTPRequestHandler):
+    # keep connections alive between requests
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, do not let Nagle delay the body
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = "Hello from {}\n".format(self.path).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class ConditionalHandler(Handler):
+    """
+    Serve `body_size` bytes per path with ETag, Last-Modified and
+    Cache-Control: max-age, and answer 304 to conditional requests.
+    """
+
+    body_size = 64 * 1024
+    max_age = 0
+    last_modified = formatdate(0, usegmt=True)
+    # body bytes sent, to measure the bandwidth a cache saves
+    bytes_sent = 0
+
+    def do_GET(self):
+        line = "Hello from {}\n".format(self.path).encode("utf-8")
+        body = (line * (self.body_size // len(line) + 1))[:self.body_size]
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+        if "If-None-Match" in self.headers:
+            unchanged = self.headers["If-None-Match"] == etag
+        elif "If-Modified-Since" in self.headers:
+            unchanged = parsedate_to_datetime(self.headers["If-Modified-Since"]) >= parsedate_to_datetime(self.last_modified)
+        else:
+            unchanged = False
+
+        self.send_response(304 if unchanged else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.send_header("Cache-Control", "max-age={}".format(self.max_age))
+        if unchanged:
+            self.end_headers()
+            return
+
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        type(self).bytes_sent += len(body)
+        self.wfile.write(body)
+
+class StreamingHandler(Handler):
+    """
+    Serve `/<megabytes>` of text with chunked transfer encoding, compressed
+    on the fly when the client accepts gzip, without holding it in memory.
+    """
+
+    def do_GET(self):
+        megabytes = int(self.path.strip("/") or 1)
+        line = b"All work and no play makes Jack a dull boy.\n"
+        block = (line * (1024 * 1024 // len(line) + 1))[:1024 * 1024]
+
+        gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        # wbits=31 writes a gzip header and trailer
+        compressor = zlib.compressobj(1, wbits=31) if gzip else None
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        if gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+
+        for _ in range(megabytes):
+            self._write_chunk(compressor.compress(block) if gzip else block)
+        if gzip:
+            self._write_chunk(compressor.flush())
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: bytes):
+        if data:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+class StandInServer:
+
+    def __init__(self, handler=Handler):
+        """
+        Local HTTP server to test and benchmark clients against.
+
+        Use it as a context manager, `url` is the base URL of the server.
+        """
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.url = "http://127.0.0.1:{}".format(self.server.server_port)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+if __name__ == "__main__":
+    with StandInServer() as server:
+        print("Serving on {}, press Ctrl+C to stop.".format(server.url))
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
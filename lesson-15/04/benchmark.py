@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# Fetch URLs one at a time and with fetch_many() from a stand-in with 50 ms latency
+
+import asyncio
+import time
+from fetch_many import fetch
+from fetch_many import fetch_many
+from server import AsyncStandInServer
+
+COUNT = 200
+
+async def main():
+    async with AsyncStandInServer(latency=0.05) as server:
+        urls = ["{}/item/{}".format(server.url, i) for i in range(COUNT)]
+        print("GET {} URLs from {} (latency {} s)".format(COUNT, server.url, server.latency))
+
+        start = time.perf_counter()
+        for url in urls:
+            await fetch(url)
+        print("one at a time         : {:.2f} s".format(time.perf_counter() - start))
+
+        for concurrency, per_host in ((10, 10), (50, 50), (50, 8)):
+            server.max_active = 0
+            start = time.perf_counter()
+            results = [result async for result in fetch_many(urls, concurrency=concurrency, per_host=per_host)]
+            elapsed = time.perf_counter() - start
+            assert sorted(r.url for r in results) == sorted(urls)
+            assert all(r.status == 200 for r in results)
+            assert server.max_active <= min(concurrency, per_host)
+            print("concurrency={:<3} host={:<3}: {:.2f} s, at most {} at once".format(
+                concurrency, per_host, elapsed, server.max_active))
+
+        # a request slower than its timeout is reported, not raised
+        server.latency = 0.5
+        results = [result async for result in fetch_many(urls[:5], timeout=0.1)]
+        assert all(isinstance(r.error, (TimeoutError, asyncio.TimeoutError)) for r in results)
+
+        # the whole batch can be bounded as well
+        try:
+            async for _ in fetch_many(urls[:5], timeout=None, total_timeout=0.1):
+                pass
+        except (TimeoutError, asyncio.TimeoutError):
+            print("\nRequest and batch timeouts work as expected")
+
+if __name__ == "__main__":
+    asyncio.run(main())
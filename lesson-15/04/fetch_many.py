@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+@dataclass
+class Result:
+    url: str
+    status: int | None = None
+    body: bytes = b""
+    error: Exception | None = None
+
+REDIRECTS = {301, 302, 303, 307, 308}
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    """Read a body sent with Transfer-Encoding: chunked."""
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b"".join(chunks), None)
+        # the size is hexadecimal, optionally followed by ;extensions
+        size = int(size_line.split(b";", 1)[0], 16)
+        if size == 0:
+            break
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+    # skip the trailer fields up to the final empty line
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass
+    return b"".join(chunks)
+
+async def _get(url: str) -> tuple[int, dict, bytes]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError("Unsupported URL scheme: {}".format(url))
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+
+    reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=parts.scheme == "https")
+    try:
+        writer.write(
+            "GET {} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\n\r\n".format(target, parts.netloc).encode("ascii")
+        )
+        await writer.drain()
+
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            body = await _read_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+        return status, headers, body
+    finally:
+        writer.close()
+
+async def fetch(url: str, max_redirects: int = 5) -> Result:
+    """
+    GET one URL on a new connection with asyncio streams.
+
+    Chunked bodies are decoded, and up to max_redirects redirects are
+    followed. Result.url is the URL that was requested.
+    """
+
+    location = url
+    for _ in range(max_redirects + 1):
+        status, headers, body = await _get(location)
+        if status not in REDIRECTS or "location" not in headers:
+            return Result(url, status, body)
+        location = urljoin(location, headers["location"])
+    raise ValueError("More than {} redirects from {}".format(max_redirects, url))
+
+async def fetch_many(urls, concurrency: int = 10, per_host: int = 4,
+                     timeout: float | None = 10.0, total_timeout: float | None = None):
+    """
+    Fetch many URLs concurrently and yield each Result as soon as it completes.
+
+    At most `concurrency` requests run at once, and at most `per_host` of them
+    to the same host. A request slower than `timeout` yields a Result with a
+    TimeoutError; if the whole batch takes longer than `total_timeout`, the
+    remaining requests are cancelled and TimeoutError is raised.
+    """
+
+    limit = asyncio.Semaphore(concurrency)
+    hosts = defaultdict(lambda: asyncio.Semaphore(per_host))
+
+    async def bounded(url: str) -> Result:
+        async with hosts[urlsplit(url).netloc], limit:
+            try:
+                return await asyncio.wait_for(fetch(url), timeout)
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, TimeoutError, asyncio.TimeoutError) as e:
+                return Result(url, error=e)
+
+    tasks = [asyncio.ensure_future(bounded(url)) for url in urls]
+    try:
+        for future in asyncio.as_completed(tasks, timeout=total_timeout):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def main():
+    urls = ["http://www.google.com", "http://www.python.org", "http://example.com"]
+    async for result in fetch_many(urls, concurrency=3):
+        print(result.url, result.status or result.error)
+
+if __name__ == "__main__":
+    asyncio.run(main())
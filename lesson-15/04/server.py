@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import asyncio
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+class AsyncStandInServer:
+
+    def __init__(self, latency: float = 0.05):
+        """
+        Local asyncio HTTP server that answers every GET after `latency` seconds.
+
+        It records the highest number of requests it served at the same time.
+        `?delay=<seconds>` overrides the latency of one request, paths under
+        /redirect/ answer with a 302 to the rest of the path, and paths under
+        /chunked/ are sent with Transfer-Encoding: chunked.
+        """
+
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self.server = None
+        self.url = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.url = "http://127.0.0.1:{}".format(self.server.sockets[0].getsockname()[1])
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            target = urlsplit(request_line.split()[1].decode("ascii"))
+            path = target.path
+            delay = parse_qs(target.query).get("delay")
+            await asyncio.sleep(float(delay[0]) if delay else self.latency)
+
+            if path.startswith("/redirect/"):
+                writer.write(
+                    b"HTTP/1.1 302 Found\r\n"
+                    b"Location: " + path[len("/redirect"):].encode("ascii") + b"\r\n"
+                    b"Content-Length: 0\r\n"
+                    b"Connection: close\r\n\r\n"
+                )
+            elif path.startswith("/chunked/"):
+                body = "Hello from {}\n".format(path).encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/plain; charset=utf-8\r\n"
+                    b"Transfer-Encoding: chunked\r\n"
+                    b"Connection: close\r\n\r\n"
+                )
+                for i in range(0, len(body), 5):
+                    chunk = body[i:i + 5]
+                    writer.write("{:x}\r\n".format(len(chunk)).encode("ascii") + chunk + b"\r\n")
+                writer.write(b"0\r\n\r\n")
+            else:
+                body = "Hello from {}\n".format(path).encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/plain; charset=utf-8\r\n"
+                    b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n"
+                    b"Connection: close\r\n\r\n" + body
+                )
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # the client gave up, or the server is shutting down
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+
+async def main():
+    async with AsyncStandInServer() as server:
+        print("Serving on {}, press Ctrl+C to stop.".format(server.url))
+        await asyncio.Event().wait()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
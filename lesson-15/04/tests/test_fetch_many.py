@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from fetch_many import fetch
+from fetch_many import fetch_many
+from server import AsyncStandInServer
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+async def collect(urls, **kwargs) -> list:
+    return [result async for result in fetch_many(urls, **kwargs)]
+
+##############################
+# Fetch Testcases
+##############################
+def test_fetch_content_length():
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            return await fetch(server.url + "/item/1")
+
+    result = run(scenario())
+    assert result.status == 200
+    assert result.body == b"Hello from /item/1\n"
+
+def test_fetch_chunked():
+    """
+    The testcase is to test that the chunk framing of a chunked reply is
+    removed from the body.
+    """
+
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            return await fetch(server.url + "/chunked/hello")
+
+    result = run(scenario())
+    assert result.status == 200
+    assert result.body == b"Hello from /chunked/hello\n"
+
+def test_fetch_follows_redirects():
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            return server.url, await fetch(server.url + "/redirect/item/2")
+
+    url, result = run(scenario())
+    assert result.url == url + "/redirect/item/2"
+    assert result.status == 200
+    assert result.body == b"Hello from /item/2\n"
+
+def test_fetch_too_many_redirects():
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            return await fetch(server.url + "/redirect/redirect/item/3", max_redirects=1)
+
+    with pytest.raises(ValueError, match="redirects"):
+        run(scenario())
+
+##############################
+# Concurrency Testcases
+##############################
+@pytest.mark.parametrize("concurrency, per_host", [(3, 10), (10, 2)])
+def test_concurrency_limit(concurrency, per_host):
+    """
+    The testcase is to test that no more than min(concurrency, per_host)
+    requests reach the single host at once.
+    """
+
+    async def scenario():
+        async with AsyncStandInServer(latency=0.02) as server:
+            urls = ["{}/item/{}".format(server.url, i) for i in range(20)]
+            results = await collect(urls, concurrency=concurrency, per_host=per_host)
+            return urls, results, server.max_active
+
+    urls, results, max_active = run(scenario())
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert all(r.status == 200 for r in results)
+    assert max_active == min(concurrency, per_host)
+
+def test_completion_order():
+    """
+    The testcase is to test that results are yielded as they complete, not
+    in the order of the URLs.
+    """
+
+    async def scenario():
+        async with AsyncStandInServer() as server:
+            delays = [0.3, 0.1, 0.2, 0.0]
+            urls = ["{}/item/{}?delay={}".format(server.url, i, d) for i, d in enumerate(delays)]
+            results = await collect(urls, concurrency=4)
+            return urls, results
+
+    urls, results = run(scenario())
+    assert [r.url for r in results] == [urls[3], urls[1], urls[2], urls[0]]
+
+##############################
+# Timeout Testcases
+##############################
+def test_request_timeout_is_reported():
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            urls = [server.url + "/slow?delay=1", server.url + "/fast"]
+            return await collect(urls, timeout=0.1)
+
+    results = {r.url.rsplit("/", 1)[1]: r for r in run(scenario())}
+    assert isinstance(results["slow?delay=1"].error, (TimeoutError, asyncio.TimeoutError))
+    assert results["fast"].status == 200
+
+def test_batch_timeout_raises_and_cancels():
+    """
+    The testcase is to test that the batch stops at total_timeout, after
+    yielding the results that completed in time, without waiting for the
+    cancelled requests.
+    """
+
+    async def scenario():
+        async with AsyncStandInServer(latency=0) as server:
+            urls = [server.url + "/fast"] + ["{}/slow/{}?delay=2".format(server.url, i) for i in range(3)]
+            received = []
+            start = asyncio.get_running_loop().time()
+            with pytest.raises((TimeoutError, asyncio.TimeoutError)):
+                async for result in fetch_many(urls, timeout=None, total_timeout=0.2):
+                    received.append(result)
+            return received, asyncio.get_running_loop().time() - start
+
+    received, elapsed = run(scenario())
+    assert [r.status for r in received] == [200]
+    assert elapsed < 1
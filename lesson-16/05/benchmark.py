@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Cost per record of validating, trusting and batch-validating users
+
+import json
+import timeit
+from pydantic import ConfigDict
+from model import User
+from model import users_from_json
+
+COUNT = 100_000
+
+class ValidatedUser(User):
+    model_config = ConfigDict(validate_assignment=True)
+
+class UnvalidatedUser(User):
+    model_config = ConfigDict(validate_assignment=False)
+
+def measure(name: str, function, number: int = 3):
+    seconds = min(timeit.repeat(function, number=1, repeat=number))
+    print("{:42} {:8.2f} µs/record".format(name, seconds * 1e6 / COUNT))
+
+if __name__ == "__main__":
+    records = [{"name": "user{}".format(i), "age": 18 + i % 70, "email": "user{}@example.com".format(i)} for i in range(COUNT)]
+    data = json.dumps(records).encode("utf-8")
+    print("{:,} users".format(COUNT))
+
+    print("\nFrom dicts")
+    measure("User(**record)", lambda: [User(**record) for record in records])
+    measure("User.model_validate(record)", lambda: [User.model_validate(record) for record in records])
+    measure("User.from_trusted(record)", lambda: [User.from_trusted(record) for record in records])
+
+    print("\nFrom a JSON array")
+    measure("json.loads() + User.model_validate()", lambda: [User.model_validate(record) for record in json.loads(data)])
+    measure("users_from_json() (TypeAdapter)", lambda: users_from_json(data))
+    measure("json.loads() + User.from_trusted()", lambda: [User.from_trusted(record) for record in json.loads(data)])
+
+    print("\nAssign user.age")
+    for cls in (ValidatedUser, UnvalidatedUser):
+        users = [cls.from_trusted(record) for record in records]
+        def assign():
+            for user in users:
+                user.age = 31
+        measure("validate_assignment={}".format(cls.model_config["validate_assignment"]), assign)
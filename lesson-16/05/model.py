@@ -1,8 +1,27 @@
+import os
 from typing import Annotated
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import TypeAdapter
+
+# VALIDATE_ASSIGNMENT=1 validates every attribute write, not only construction
+VALIDATE_ASSIGNMENT = os.environ.get("VALIDATE_ASSIGNMENT", "false").lower() in ("true", "1")
 
 class User(BaseModel):
     name: Annotated[str, Field(max_length=100)]
     age: Annotated[int, Field(ge=0)]
     email: Annotated[str, Field(pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$")]
+
+    model_config = ConfigDict(validate_assignment=VALIDATE_ASSIGNMENT)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "User":
+        """Create a user from data that was validated before, without validating it again."""
+        return cls.model_construct(**data)
+
+# built once, validates a JSON array of users in a single call
+USER_LIST = TypeAdapter(list[User])
+
+def users_from_json(data: bytes | str) -> list[User]:
+    return USER_LIST.validate_json(data)
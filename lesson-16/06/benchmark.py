@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# Compare the User models of lesson-16/01-05 and dataclass variants on common operations
+
+import argparse
+from dataclasses import asdict
+from dataclasses import dataclass
+import gc
+import importlib.util
+import json
+import operator
+from pathlib import Path
+import time
+import tracemalloc
+from typing import Callable
+import model
+
+@dataclass
+class Representation:
+    label: str
+    make: Callable  # (name, age, email) -> user
+    age: Callable   # user -> age
+    dump: Callable  # user -> dict for json.dumps()
+    load: Callable  # dict from json.loads() -> user
+
+def load_model(lesson: str):
+    # every lesson names its module model.py
+    path = Path(__file__).resolve().parent.parent / lesson / "model.py"
+    spec = importlib.util.spec_from_file_location("model_{}".format(lesson), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.User
+
+def representations() -> list[Representation]:
+    result = [
+        Representation("dict (01)", lambda n, a, e: {"name": n, "age": a, "email": e},
+                       operator.itemgetter("age"), lambda u: u, lambda d: d),
+    ]
+
+    User = load_model("02")
+    result.append(Representation("namedtuple (02)", User, operator.attrgetter("age"),
+                                 User._asdict, lambda d, User=User: User(**d)))
+
+    User = load_model("03")
+    result.append(Representation("class (03)", User, operator.attrgetter("age"),
+                                 vars, lambda d, User=User: User(**d)))
+
+    for label, User in (("dataclass (04)", load_model("04")),
+                        ("dataclass slots", model.SlottedUser),
+                        ("dataclass frozen", model.FrozenUser),
+                        ("dataclass frozen slots", model.FrozenSlottedUser)):
+        result.append(Representation(label, User, operator.attrgetter("age"),
+                                     asdict, lambda d, User=User: User(**d)))
+
+    try:
+        User = load_model("05")
+    except ImportError:
+        print("pydantic is not installed, skipping 05")
+    else:
+        result.append(Representation("pydantic (05)", lambda n, a, e, User=User: User(name=n, age=a, email=e),
+                                     operator.attrgetter("age"), User.model_dump, User.model_validate))
+
+    return result
+
+def timed(function, *args) -> tuple[object, float]:
+    gc.collect()
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def build(representation: Representation, columns) -> list:
+    return list(map(representation.make, *columns))
+
+def measure(representation: Representation, columns, count: int) -> dict:
+    row = {}
+
+    # memory of the instances only, the strings are shared by every model
+    gc.collect()
+    tracemalloc.start()
+    users = build(representation, columns)
+    row["bytes"] = tracemalloc.get_traced_memory()[0] / count
+    tracemalloc.stop()
+    del users
+
+    users, seconds = timed(build, representation, columns)
+    row["construct"] = seconds
+    copies = build(representation, columns)
+
+    _, row["access"] = timed(lambda: sum(map(representation.age, users)))
+    _, row["equality"] = timed(lambda: sum(map(operator.eq, users, copies)))
+    try:
+        _, row["hash"] = timed(lambda: set(map(hash, users)))
+    except TypeError:
+        row["hash"] = None
+
+    def round_trip():
+        data = json.dumps(list(map(representation.dump, users)))
+        return list(map(representation.load, json.loads(data)))
+    _, row["json"] = timed(round_trip)
+
+    return row
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lesson-16 User models.")
+    parser.add_argument("--count", type=int, nargs="+", default=[1_000_000],
+                        help="Numbers of records, e.g. --count 1000000 10000000 (default: 1000000).")
+    args = parser.parse_args()
+
+    for count in args.count:
+        # a distinct name and email per record, like rows loaded from a store
+        names = ["user{}".format(i) for i in range(count)]
+        ages = [18 + i % 70 for i in range(count)]
+        emails = ["user{}@example.com".format(i) for i in range(count)]
+        columns = (names, ages, emails)
+
+        print("\n{:,} records, ns per record (n/a: not hashable, class (03) compares and hashes by identity)\n".format(count))
+        print("| {:22} | {:>9} | {:>6} | {:>8} | {:>6} | {:>6} | {:>14} |".format(
+            "model", "construct", "access", "equality", "hash", "json", "bytes/instance"))
+        print("|{}|{}:|{}:|{}:|{}:|{}:|{}:|".format("-" * 24, "-" * 10, "-" * 7, "-" * 9, "-" * 7, "-" * 7, "-" * 15))
+        for representation in representations():
+            row = measure(representation, columns, count)
+            ns = {k: "n/a" if v is None else "{:.0f}".format(v * 1e9 / count) for k, v in row.items() if k != "bytes"}
+            print("| {:22} | {:>9} | {:>6} | {:>8} | {:>6} | {:>6} | {:>14.0f} |".format(
+                representation.label, ns["construct"], ns["access"], ns["equality"], ns["hash"], ns["json"], row["bytes"]))
+
+if __name__ == "__main__":
+    main()
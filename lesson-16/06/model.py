@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class SlottedUser:
+    name: str
+    age: int
+    email: str
+
+@dataclass(frozen=True)
+class FrozenUser:
+    name: str
+    age: int
+    email: str
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlottedUser:
+    name: str
+    age: int
+    email: str
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Compare a list[User] with a UserTable for memory and filter throughput
+
+import gc
+import time
+import tracemalloc
+from model import User
+import table as columnar
+from table import UserTable
+
+COUNT = 1_000_000
+
+def measure(name: str, function, number: int = 5):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(number):
+        result = function()
+    elapsed = (time.perf_counter() - start) / number
+    print("{:42} {:8.1f} ms {:8.1f} M rows/s  {:>8,} matches".format(
+        name, elapsed * 1000, COUNT / elapsed / 1e6, len(result)))
+
+def traced(function):
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+if __name__ == "__main__":
+    # the strings are created inside the measurement, like records loaded from a file
+    users, size = traced(lambda: [User("user{}".format(i), 18 + i % 70, "user{}@example{}.com".format(i, i % 10)) for i in range(COUNT)])
+    print("Memory for {:,} users".format(COUNT))
+    print("{:42} {:8.1f} MB".format("list[User]", size / 2**20))
+    table, size = traced(lambda: UserTable.from_users(users))
+    print("{:42} {:8.1f} MB".format("UserTable", size / 2**20))
+
+    print("\nFilter {:,} users".format(COUNT))
+    measure("list[User] age >= 30", lambda: [u for u in users if u.age >= 30])
+    measure("UserTable  age >= 30", lambda: table.where("age", ">=", 30))
+    if columnar.np is not None:
+        np, columnar.np = columnar.np, None
+        measure("UserTable  age >= 30 (without numpy)", lambda: table.where("age", ">=", 30))
+        columnar.np = np
+
+    measure("list[User] email endswith @example3.com", lambda: [u for u in users if u.email.endswith("@example3.com")])
+    measure("UserTable  email endswith @example3.com", lambda: table.where("email", "endswith", "@example3.com"))
+    measure("list[User] name == user123456", lambda: [u for u in users if u.name == "user123456"])
+    measure("UserTable  name == user123456", lambda: table.where("name", "==", "user123456"))
+
+    print("\nProject the name of users with age >= 30")
+    measure("list[User]", lambda: [u.name for u in users if u.age >= 30])
+    measure("UserTable", lambda: table.project(["name"], table.where("age", ">=", 30)))
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+from model import User
+from table import UserTable
+
+if __name__ == "__main__":
+    table = UserTable.from_users([
+        User(name="Alice", age=30, email="alice@example.com"),
+        User(name="Bob", age=25, email="bob@example.org"),
+        User(name="Carol", age=41, email="carol@example.com"),
+    ])
+    table.append(User(name="Dave", age=35, email="dave@example.net"))
+
+    rows = table.where("age", ">=", 30)
+    print(f"age >= 30: {table.project(['name', 'age'], rows)}")
+
+    rows = table.where("email", "endswith", "@example.com", rows=rows)
+    print(f"... and email at example.com: {table.rows(rows)}")
+
+    user = table[0]
+    print(f"First row: {user.name}, equal to a User: {user == User('Alice', 30, 'alice@example.com')}")
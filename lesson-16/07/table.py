@@ -0,0 +1,248 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from itertools import compress
+from itertools import repeat
+import operator
+from model import User
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OPERATORS = {
+    "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+}
+
+class StringColumn:
+
+    def __init__(self, values=()):
+        """
+        Strings stored back to back as UTF-8 in one buffer.
+
+        Row i is data[offsets[i]:offsets[i + 1]], so a column costs one
+        bytearray and 8 bytes per row instead of one str object per row.
+        """
+
+        encoded = [value.encode("utf-8") for value in values]
+        self.data = bytearray(b"".join(encoded))
+        self.offsets = array("q", accumulate(map(len, encoded), initial=0))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+    def append(self, value: str):
+        self.data += value.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def take(self, rows) -> list[str]:
+        """The values of rows, decoding the buffer in one step if it is ASCII."""
+        data = self.data
+        offsets = self.offsets
+        if isinstance(rows, range) and rows == range(len(self)):
+            starts, ends = offsets[:-1], offsets[1:]
+        elif np is not None:
+            view = np.frombuffer(offsets, dtype=np.int64)
+            indices = np.asarray(rows, dtype=np.int64)
+            starts = view[indices].tolist()
+            ends = view[indices + 1].tolist()
+        else:
+            starts = [offsets[i] for i in rows]
+            ends = [offsets[i + 1] for i in rows]
+
+        if data.isascii():
+            text = data.decode("ascii")
+            return [text[start:end] for start, end in zip(starts, ends)]
+        return [str(data[start:end], "utf-8") for start, end in zip(starts, ends)]
+
+    def match(self, op: str, value: str) -> array:
+        """
+        Rows whose value is ==, startswith, endswith or contains value.
+
+        With numpy, the bytes at the start or end of every row are compared
+        at once. Otherwise, and for contains, the buffer is searched with
+        bytes.find(), so only the matches are visited in Python.
+        """
+
+        if op not in ("==", "startswith", "endswith", "contains"):
+            raise ValueError("Unsupported string operator: {}".format(op))
+
+        needle = value.encode("utf-8")
+        offsets = self.offsets
+        if not needle:
+            rows = range(len(self))
+            if op == "==":
+                rows = compress(rows, (offsets[i] == offsets[i + 1] for i in rows))
+            return array("q", rows)
+
+        if np is not None and op != "contains":
+            return self._compare(op, needle)
+
+        rows = array("q")
+        data = self.data
+        position = data.find(needle)
+        while position != -1:
+            row = bisect_right(offsets, position) - 1
+            start, end = offsets[row], offsets[row + 1]
+            if position + len(needle) <= end and (
+                op == "contains"
+                or (op == "startswith" and position == start)
+                or (op == "endswith" and position + len(needle) == end)
+                or (op == "==" and position == start and position + len(needle) == end)
+            ):
+                rows.append(row)
+                position = data.find(needle, end)
+            elif op in ("==", "startswith") and position > start:
+                # only a match at the start of a row counts
+                position = data.find(needle, end)
+            else:
+                position = data.find(needle, position + 1)
+        return rows
+
+    def _compare(self, op: str, needle: bytes) -> array:
+        data = np.frombuffer(self.data, dtype=np.uint8)
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        lengths = np.diff(offsets)
+
+        rows = np.flatnonzero(lengths == len(needle) if op == "==" else lengths >= len(needle))
+        starts = offsets[rows + 1] - len(needle) if op == "endswith" else offsets[rows]
+        # compare one byte position of every remaining row at a time
+        for i, byte in enumerate(needle):
+            keep = data[starts + i] == byte
+            rows = rows[keep]
+            starts = starts[keep]
+            if not len(rows):
+                break
+        return array("q", rows.astype(np.int64).tobytes())
+
+class UserRow:
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "UserTable", index: int):
+        """A view of one row, fields are read from the columns on access."""
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._index]
+
+    @property
+    def age(self) -> int:
+        return self._table.ages[self._index]
+
+    @property
+    def email(self) -> str:
+        return self._table.emails[self._index]
+
+    def to_user(self) -> User:
+        return User(self.name, self.age, self.email)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (User, UserRow)):
+            return NotImplemented
+        return (self.name, self.age, self.email) == (other.name, other.age, other.email)
+
+    def __repr__(self) -> str:
+        return "UserRow(name={!r}, age={!r}, email={!r})".format(self.name, self.age, self.email)
+
+class UserTable:
+
+    def __init__(self):
+        """
+        Users stored column by column.
+
+        ages is an array('i'), names and emails are StringColumns. Filters
+        return the matching row numbers as an array('q').
+        """
+
+        self.ages = array("i")
+        self.names = StringColumn()
+        self.emails = StringColumn()
+
+    @classmethod
+    def from_users(cls, users) -> "UserTable":
+        users = list(users)
+        table = cls()
+        table.ages = array("i", map(operator.attrgetter("age"), users))
+        table.names = StringColumn(map(operator.attrgetter("name"), users))
+        table.emails = StringColumn(map(operator.attrgetter("email"), users))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def __getitem__(self, index: int) -> UserRow:
+        if not -len(self) <= index < len(self):
+            raise IndexError("UserTable index out of range")
+        return UserRow(self, index % len(self))
+
+    def __iter__(self):
+        return map(UserRow, repeat(self), range(len(self)))
+
+    def append(self, user: User):
+        self.ages.append(user.age)
+        self.names.append(user.name)
+        self.emails.append(user.email)
+
+    def where(self, column: str, op: str, value, rows: array | None = None) -> array:
+        """
+        Row numbers where `column op value` holds, within rows if given.
+
+        age supports ==, !=, <, <=, > and >=, name and email support ==,
+        startswith, endswith and contains.
+        """
+
+        if column in ("name", "email"):
+            matches = getattr(self, column + "s").match(op, value)
+            if rows is None:
+                return matches
+            wanted = set(rows)
+            return array("q", (row for row in matches if row in wanted))
+
+        if column != "age":
+            raise ValueError("Unknown column: {}".format(column))
+        compare = OPERATORS[op]
+
+        if np is not None:
+            # a view of the array, not a copy
+            ages = np.frombuffer(self.ages, dtype=np.int32)
+            if rows is None:
+                selected = np.flatnonzero(compare(ages, value))
+            else:
+                indices = np.frombuffer(rows, dtype=np.int64)
+                selected = indices[compare(ages[indices], value)]
+            return array("q", selected.astype(np.int64).tobytes())
+
+        if rows is None:
+            return array("q", compress(range(len(self.ages)), map(compare, self.ages, repeat(value))))
+        ages = self.ages
+        return array("q", (row for row in rows if compare(ages[row], value)))
+
+    def project(self, columns: list[str], rows: array | None = None) -> list[tuple]:
+        """The given columns of rows (all rows by default) as tuples."""
+        if rows is None:
+            rows = range(len(self))
+        return list(zip(*(self.column(column, rows) for column in columns)))
+
+    def column(self, column: str, rows: array | None = None) -> list:
+        """The values of one column for rows (all rows by default)."""
+        if rows is None:
+            rows = range(len(self))
+        if column == "age":
+            if np is not None and isinstance(rows, array):
+                return np.frombuffer(self.ages, dtype=np.int32)[np.frombuffer(rows, dtype=np.int64)].tolist()
+            ages = self.ages
+            return [ages[row] for row in rows]
+        if column in ("name", "email"):
+            return getattr(self, column + "s").take(rows)
+        raise ValueError("Unknown column: {}".format(column))
+
+    def rows(self, rows: array) -> list[UserRow]:
+        return [UserRow(self, row) for row in rows]
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Compare the binary codec with json and pickle for 1M users
+
+import gc
+import json
+import pickle
+import time
+from codec import decode_many
+from codec import encode_many
+from codec import records
+from model import User
+
+COUNT = 1_000_000
+
+def measure(name: str, encode, decode) -> bytes:
+    gc.collect()
+    start = time.perf_counter()
+    data = encode(users)
+    encoded = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    decoded = decode(data)
+    elapsed = time.perf_counter() - start
+    assert len(decoded) == COUNT
+
+    print("{:8} {:8.1f} MB {:10.3f} s encode {:10.3f} s decode".format(name, len(data) / 2**20, encoded, elapsed))
+    return data
+
+def to_json(users: list[User]) -> bytes:
+    return json.dumps([{"name": u.name, "age": u.age, "email": u.email} for u in users]).encode("utf-8")
+
+def from_json(data: bytes) -> list[User]:
+    return [User(**d) for d in json.loads(data)]
+
+if __name__ == "__main__":
+    users = [User("user{}".format(i), 18 + i % 70, "user{}@example.com".format(i)) for i in range(COUNT)]
+    print("{:,} users".format(COUNT))
+
+    measure("json", to_json, from_json)
+    measure("pickle", lambda u: pickle.dumps(u, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+    data = measure("struct", encode_many, decode_many)
+    assert decode_many(data) == users
+
+    # lazy access reads the header of each record, not the strings
+    gc.collect()
+    start = time.perf_counter()
+    total = sum(record.age for record in records(data))
+    print("\nSum of ages from UserRecord views: {:.3f} s".format(time.perf_counter() - start))
+    start = time.perf_counter()
+    assert total == sum(user.age for user in decode_many(data))
+    print("Sum of ages after decode_many():   {:.3f} s".format(time.perf_counter() - start))
@@ -0,0 +1,135 @@
+import struct
+from model import User
+
+# a buffer starts with the number of records
+COUNT = struct.Struct("<I")
+# every record starts with its age and the byte lengths of name and email,
+# followed by the UTF-8 bytes of name and email
+HEADER = struct.Struct("<iHH")
+MAX_LENGTH = 0xFFFF
+
+class DecodeError(ValueError):
+    pass
+
+def _encode(user: User) -> tuple[bytes, bytes, bytes]:
+    name = user.name.encode("utf-8")
+    email = user.email.encode("utf-8")
+    if len(name) > MAX_LENGTH or len(email) > MAX_LENGTH:
+        raise ValueError("name and email must be at most {} bytes".format(MAX_LENGTH))
+    return HEADER.pack(user.age, len(name), len(email)), name, email
+
+def encode(user: User) -> bytes:
+    return b"".join(_encode(user))
+
+def encode_many(users: list[User]) -> bytes:
+    parts = [COUNT.pack(len(users))]
+    for user in users:
+        parts += _encode(user)
+    return b"".join(parts)
+
+def decode(buffer, offset: int = 0) -> User:
+    return decode_from(memoryview(buffer), offset)[0]
+
+def decode_from(view: memoryview, offset: int) -> tuple[User, int]:
+    """Decode the record at offset, returns it and the offset of the next one."""
+    try:
+        age, name_length, email_length = HEADER.unpack_from(view, offset)
+    except struct.error:
+        raise DecodeError("Truncated record header at offset {}".format(offset)) from None
+
+    start = offset + HEADER.size
+    end = start + name_length + email_length
+    if end > len(view):
+        raise DecodeError("Truncated record at offset {}".format(offset))
+    try:
+        name = str(view[start:start + name_length], "utf-8")
+        email = str(view[start + name_length:end], "utf-8")
+    except UnicodeDecodeError as e:
+        raise DecodeError("Invalid UTF-8 in record at offset {}: {}".format(offset, e)) from None
+    return User(name, age, email), end
+
+def decode_many(buffer) -> list[User]:
+    view = memoryview(buffer)
+    try:
+        count, = COUNT.unpack_from(view, 0)
+    except struct.error:
+        raise DecodeError("Truncated buffer") from None
+
+    # the loop of decode_from() inlined
+    users = []
+    append = users.append
+    unpack_from = HEADER.unpack_from
+    size = len(view)
+    offset = COUNT.size
+    try:
+        for _ in range(count):
+            age, name_length, email_length = unpack_from(view, offset)
+            start = offset + HEADER.size
+            middle = start + name_length
+            end = middle + email_length
+            # slicing clips at the end of the view, so check before decoding
+            if end > size:
+                raise DecodeError("Truncated record at offset {}".format(offset))
+            append(User(str(view[start:middle], "utf-8"), age, str(view[middle:end], "utf-8")))
+            offset = end
+    except struct.error:
+        raise DecodeError("Truncated record header at offset {}".format(offset)) from None
+    except UnicodeDecodeError as e:
+        raise DecodeError("Invalid UTF-8 in record at offset {}: {}".format(offset, e)) from None
+    return users
+
+class UserRecord:
+    __slots__ = ("_view", "_offset")
+
+    def __init__(self, view: memoryview, offset: int):
+        """An encoded record, each field is decoded only when it is read."""
+        self._view = view
+        self._offset = offset
+
+    @property
+    def age(self) -> int:
+        return HEADER.unpack_from(self._view, self._offset)[0]
+
+    @property
+    def name(self) -> str:
+        _, name_length, _ = HEADER.unpack_from(self._view, self._offset)
+        start = self._offset + HEADER.size
+        return str(self._view[start:start + name_length], "utf-8")
+
+    @property
+    def email(self) -> str:
+        _, name_length, email_length = HEADER.unpack_from(self._view, self._offset)
+        start = self._offset + HEADER.size + name_length
+        return str(self._view[start:start + email_length], "utf-8")
+
+    def to_user(self) -> User:
+        return decode_from(self._view, self._offset)[0]
+
+    def __repr__(self) -> str:
+        return "UserRecord(name={!r}, age={!r}, email={!r})".format(self.name, self.age, self.email)
+
+def records(buffer) -> list[UserRecord]:
+    """
+    Views of every record in buffer, without decoding any string.
+
+    Only the headers are read to find where each record starts.
+    """
+
+    view = memoryview(buffer)
+    try:
+        count, = COUNT.unpack_from(view, 0)
+    except struct.error:
+        raise DecodeError("Truncated buffer") from None
+
+    result = []
+    offset = COUNT.size
+    unpack_from = HEADER.unpack_from
+    for _ in range(count):
+        if offset + HEADER.size > len(view):
+            raise DecodeError("Truncated record header at offset {}".format(offset))
+        result.append(UserRecord(view, offset))
+        _, name_length, email_length = unpack_from(view, offset)
+        offset += HEADER.size + name_length + email_length
+    if offset > len(view):
+        raise DecodeError("Truncated record at offset {}".format(offset))
+    return result
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+from codec import decode_many
+from codec import encode_many
+from codec import records
+from model import User
+
+if __name__ == "__main__":
+    users = [
+        User(name="Alice", age=30, email="alice@example.com"),
+        User(name="Björn", age=25, email="bjorn@example.se"),
+    ]
+
+    data = encode_many(users)
+    print(f"Encoded {len(users)} users in {len(data)} bytes: {data[:24].hex(' ')} ...")
+    print(f"Decoded: {decode_many(data)}")
+
+    # read only the ages, without decoding names and emails
+    print(f"Ages: {[record.age for record in records(data)]}")
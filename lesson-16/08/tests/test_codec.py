@@ -0,0 +1,57 @@
+import pytest
+from codec import HEADER
+from codec import DecodeError
+from codec import decode
+from codec import decode_many
+from codec import encode
+from codec import encode_many
+from codec import records
+from model import User
+
+USERS = [
+    User(name="Alice", age=30, email="alice@example.com"),
+    User(name="Björn", age=25, email="bjorn@example.se"),
+]
+
+##############################
+# Round Trip Testcases
+##############################
+def test_round_trip():
+    data = encode_many(USERS)
+    assert decode_many(data) == USERS
+    assert [record.to_user() for record in records(data)] == USERS
+    assert decode(encode(USERS[1])) == USERS[1]
+
+##############################
+# Truncation Testcases
+##############################
+@pytest.mark.parametrize("cut", range(1, 40))
+def test_truncated_buffer(cut):
+    """
+    The testcase is to test that every cut of a buffer raises DecodeError,
+    including cuts inside the multi-byte "ö" of the last name and cuts that
+    leave a shorter but valid string.
+    """
+
+    data = encode_many(USERS)[:-cut]
+    with pytest.raises(DecodeError):
+        decode_many(data)
+    with pytest.raises(DecodeError):
+        records(data)
+
+def test_truncated_inside_character():
+    data = encode_many(USERS)
+    # the second byte of "ö" in "Björn"
+    cut = data.index("ö".encode("utf-8")) + 1
+    with pytest.raises(DecodeError):
+        decode_many(data[:cut])
+    with pytest.raises(DecodeError):
+        decode(encode(USERS[1])[:HEADER.size + 3])
+
+def test_invalid_utf8():
+    data = bytearray(encode(USERS[1]))
+    data[HEADER.size] = 0xFF
+    with pytest.raises(DecodeError):
+        decode(data)
+    with pytest.raises(DecodeError):
+        decode_many(b"\x01\x00\x00\x00" + data)
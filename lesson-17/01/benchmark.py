@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Rows per second of loading users into SQLite with each setting
+
+import argparse
+from pathlib import Path
+import sqlite3
+import tempfile
+import time
+from loader import bulk_load
+from loader import connect
+from loader import create_indexes
+from loader import INSERT
+from loader import SCHEMA
+
+def rows(count: int):
+    return (("user{}".format(i), 18 + i % 70) for i in range(count))
+
+def execute_per_row(path: Path, count: int, batch_size: int):
+    # like main.py: one execute() per row and the index created up front
+    con = sqlite3.connect(path)
+    con.execute(SCHEMA)
+    create_indexes(con)
+    cur = con.cursor()
+    for row in rows(count):
+        cur.execute(INSERT, row)
+    con.commit()
+    con.close()
+
+def loader(index_first: bool = False, **pragmas):
+    def load(path: Path, count: int, batch_size: int):
+        con = connect(path, **pragmas)
+        if index_first:
+            con.execute(SCHEMA)
+            create_indexes(con)
+        bulk_load(con, rows(count), batch_size=batch_size)
+        con.close()
+    return load
+
+SETTINGS = {
+    "execute() per row": execute_per_row,
+    "executemany(), index first": loader(index_first=True),
+    "executemany(), index after": loader(),
+    "+ WAL": loader(wal=True),
+    "+ synchronous=NORMAL": loader(wal=True, synchronous_normal=True),
+    "+ temp_store=MEMORY, mmap": loader(wal=True, synchronous_normal=True, temp_store_memory=True, mmap_size=2**30),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk loading into SQLite.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Rows to load (default: 10000000).")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per transaction (default: 50000).")
+    args = parser.parse_args()
+
+    print("Load {:,} rows, {:,} per transaction".format(args.rows, args.batch_size))
+    for name, load in SETTINGS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "bulk.db"
+            start = time.perf_counter()
+            load(path, args.rows, args.batch_size)
+            elapsed = time.perf_counter() - start
+
+            con = sqlite3.connect(path)
+            assert con.execute("SELECT count(*) FROM user").fetchone()[0] == args.rows
+            con.close()
+        print("{:30} {:8.1f} s {:12,.0f} rows/s".format(name, elapsed, args.rows / elapsed))
+
+if __name__ == "__main__":
+    main()
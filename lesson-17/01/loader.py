@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+from itertools import islice
+from pathlib import Path
+import sqlite3
+from typing import Iterable
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS user(id INTEGER PRIMARY KEY, name TEXT, age INTEGER)"
+INDEXES = ["CREATE INDEX IF NOT EXISTS idx_user_age_name ON user(age, name)"]
+INSERT = "INSERT INTO user (name, age) VALUES (?, ?)"
+
+def connect(path: Path | str, wal: bool = False, synchronous_normal: bool = False,
+            temp_store_memory: bool = False, mmap_size: int = 0) -> sqlite3.Connection:
+    """
+    Open a database for bulk loading, every PRAGMA is opt-in.
+
+    wal switches to the write-ahead log, synchronous_normal syncs to disk at
+    checkpoints instead of every commit (safe with WAL, but the last commits
+    may be lost on power failure), temp_store_memory keeps temporary tables
+    and indexes in memory, and mmap_size maps that many bytes of the file.
+    """
+
+    # isolation_level=None: transactions are begun and committed explicitly
+    con = sqlite3.connect(path, isolation_level=None)
+    if wal:
+        con.execute("PRAGMA journal_mode=WAL")
+    if synchronous_normal:
+        con.execute("PRAGMA synchronous=NORMAL")
+    if temp_store_memory:
+        con.execute("PRAGMA temp_store=MEMORY")
+    if mmap_size:
+        con.execute("PRAGMA mmap_size={:d}".format(mmap_size))
+    return con
+
+def bulk_load(con: sqlite3.Connection, rows: Iterable[tuple], batch_size: int = 50_000,
+              indexes: bool = True) -> int:
+    """
+    Insert (name, age) rows with executemany(), one transaction per batch.
+
+    Indexes are created after the load, which is faster than updating them
+    for every row. Returns the number of rows inserted.
+    """
+
+    con.execute(SCHEMA)
+    rows = iter(rows)
+    count = 0
+    while batch := list(islice(rows, batch_size)):
+        con.execute("BEGIN")
+        try:
+            con.executemany(INSERT, batch)
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+        count += len(batch)
+
+    if indexes:
+        create_indexes(con)
+    return count
+
+def create_indexes(con: sqlite3.Connection):
+    con.execute("BEGIN")
+    for statement in INDEXES:
+        con.execute(statement)
+    con.execute("COMMIT")
+
+if __name__ == "__main__":
+    workdir = Path(__file__).parent
+    con = connect(workdir / "bulk.db", wal=True, synchronous_normal=True)
+    count = bulk_load(con, (("user{}".format(i), 18 + i % 70) for i in range(100_000)))
+    print("Loaded {} rows".format(count))
+
+    rows = con.execute("SELECT count(*) FROM user WHERE age >= 30").fetchone()
+    print("Users aged 30 or older: {}".format(rows[0]))
+    con.close()
+
+    # Clean up the database files after execution
+    for path in workdir.glob("bulk.db*"):
+        path.unlink()
@@ -9,6 +9,8 @@ if __name__ == "__main__":
     con = sqlite3.connect(workdir / "tutorial.db")
     cur = con.cursor()
     cur.execute("CREATE TABLE user(id INTEGER PRIMARY KEY, name TEXT, age INTEGER)")
+    # Covering index for the age query below, so it does not scan the table
+    cur.execute("CREATE INDEX idx_user_age_name ON user(age, name)")
     cur.execute("INSERT INTO user (name, age) VALUES (?, ?)", ("Alice", 30))
     cur.execute("INSERT INTO user (name, age) VALUES (?, ?)", ("Bob", 25))
     cur.execute("INSERT INTO user (name, age) VALUES (?, ?)", ("Charlie", 35))
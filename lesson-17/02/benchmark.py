@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+# Queries and time to load users with their addresses, for each loading strategy
+
+import argparse
+import math
+import time
+from counter import QueryCounter
+from model import Address
+from model import Base
+from model import User
+from query import LOADERS
+from query import users_aged
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+def populate(engine, users: int, addresses: int):
+    with Session(engine) as session:
+        session.execute(insert(User), [{"id": i, "name": "user{}".format(i), "age": 18 + i % 70} for i in range(1, users + 1)])
+        session.execute(insert(Address), [
+            {"email_address": "user{}.{}@example.com".format(i, j), "user_id": i}
+            for i in range(1, users + 1) for j in range(addresses)
+        ])
+        session.commit()
+
+def expected_queries(strategy: str, users: int) -> int:
+    return {
+        "lazy": 1 + users,
+        "select": 1 + math.ceil(users / 500),
+        "joined": 1,
+        "subquery": 2,
+    }[strategy]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading strategies of User.addresses.")
+    parser.add_argument("--users", type=int, default=100_000, help="Users to load (default: 100000).")
+    parser.add_argument("--addresses", type=int, default=5, help="Addresses per user (default: 5).")
+    parser.add_argument("--strategy", nargs="+", choices=list(LOADERS), default=list(LOADERS), help="Strategies to run (default: all).")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    populate(engine, args.users, args.addresses)
+
+    print("Load {:,} users with {} addresses each".format(args.users, args.addresses))
+    for strategy in args.strategy:
+        limit = expected_queries(strategy, args.users)
+        with Session(engine) as session, QueryCounter(engine, limit=limit) as counter:
+            start = time.perf_counter()
+            users = users_aged(session, 0, addresses=strategy)
+            total = sum(len(user.addresses) for user in users)
+            elapsed = time.perf_counter() - start
+
+        assert len(users) == args.users
+        assert total == args.users * args.addresses
+        print("{:10} {:8,} queries {:8.2f} s".format(strategy, counter.count, elapsed))
+
+if __name__ == "__main__":
+    main()
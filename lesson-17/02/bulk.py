@@ -0,0 +1,64 @@
+"""
+Bulk import of users with their addresses through Core insert().
+
+`session.add_all()` tracks every object in the unit of work and flushes
+them one mapper at a time. Here users are inserted with one executemany()
+per batch, which SQLAlchemy sends as multi-row INSERT ... VALUES statements
+("insertmanyvalues") with RETURNING for the new ids. The addresses of the
+batch are inserted in bulk with those ids.
+"""
+
+from itertools import islice
+from typing import Iterable
+from model import Address
+from model import User
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+def import_users(session: Session, users: Iterable[dict], batch_size: int = 1000,
+                 page_size: int | None = None) -> int:
+    """
+    Insert users, batch_size at a time, and return how many were inserted.
+
+    Each user is a dict with name, age and addresses (a list of email
+    addresses). page_size is the number of rows per INSERT ... RETURNING
+    statement (insertmanyvalues_page_size, 1000 by default). The caller
+    commits.
+
+    The ids come back in the order of the users with
+    sort_by_parameter_order=True; on SQLite the _sentinel column of User
+    keeps that in multi-row statements. Dialects without RETURNING for
+    executemany (MySQL, unlike MariaDB) get the id of each user from its own
+    INSERT; the addresses are still inserted in bulk.
+    """
+
+    conn = session.connection()
+    if page_size is not None:
+        conn = conn.execution_options(insertmanyvalues_page_size=page_size)
+    dialect = conn.dialect
+
+    insert_user = insert(User.__table__)
+    insert_address = insert(Address.__table__)
+    returning = dialect.insert_executemany_returning
+    if returning:
+        insert_user = insert_user.returning(User.__table__.c.id, sort_by_parameter_order=True)
+
+    count = 0
+    users = iter(users)
+    while batch := list(islice(users, batch_size)):
+        rows = [{"name": user["name"], "age": user["age"]} for user in batch]
+        if returning:
+            ids = list(conn.execute(insert_user, rows).scalars())
+        else:
+            ids = [conn.execute(insert_user, row).inserted_primary_key[0] for row in rows]
+
+        addresses = [
+            {"email_address": email_address, "user_id": new_id}
+            for new_id, user in zip(ids, batch)
+            for email_address in user.get("addresses", ())
+        ]
+        if addresses:
+            conn.execute(insert_address, addresses)
+        count += len(batch)
+
+    return count
@@ -0,0 +1,43 @@
+"""
+Count the SQL statements an engine executes, through SQLAlchemy events.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+class QueryCounter:
+
+    def __init__(self, engine: Engine, limit: int | None = None):
+        """
+        Count the statements executed on engine inside a `with` block.
+
+        With a limit, leaving the block raises AssertionError when more
+        statements were executed, so it can guard N+1 regressions in tests:
+
+            with QueryCounter(engine, limit=2):
+                users_aged(session, 30, addresses="select")
+
+        An executemany() counts as one statement.
+        """
+
+        self.engine = engine
+        self.limit = limit
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self):
+        self.statements.clear()
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        if exc_type is None and self.limit is not None and self.count > self.limit:
+            raise AssertionError("Expected at most {} queries, executed {}:\n{}".format(
+                self.limit, self.count, "\n".join(self.statements[:10])))
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
+from counter import QueryCounter
 from model import User
 from model import Address
+from query import users_aged
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
@@ -39,12 +41,14 @@ if __name__ == "__main__":
 
         # auto close session
 
-    # Query users aged 30 or older
-    with Session(engine) as session:
-        stmt = session.query(User).filter(User.age >= 30)
-        for user in stmt:
+    # Query users aged 30 or older, their addresses are loaded by one more
+    # query instead of one query per user
+    with Session(engine) as session, QueryCounter(engine, limit=2) as counter:
+        for user in users_aged(session, 30, addresses="select"):
             print(user)
             for address in user.addresses:
                 print("  ", address)
 
         # auto close session
+
+    print("Executed {} queries".format(counter.count))
@@ -1,8 +1,10 @@
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import orm_insert_sentinel
 from sqlalchemy.orm import relationship
 
 class Base(DeclarativeBase):
@@ -10,9 +12,14 @@ class Base(DeclarativeBase):
 
 class User(Base):
     __tablename__ = "user"
+    # covers `WHERE age >= ?` without visiting the table
+    __table_args__ = (Index("ix_user_age_name", "age", "name"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30))
     age: Mapped[int] = mapped_column()
+    # set to the position of each row in a multi-row INSERT, so that the ids
+    # from RETURNING can be matched to the rows on SQLite too (see bulk.py)
+    _sentinel: Mapped[int] = orm_insert_sentinel()
 
     addresses : Mapped[list["Address"]] = relationship(back_populates="user", cascade="all, delete-orphan")
 
@@ -25,7 +32,7 @@ class Address(Base):
     __tablename__ = "address"
     id: Mapped[int] = mapped_column(primary_key=True)
     email_address: Mapped[str] = mapped_column(String(50), nullable=False)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
 
     user: Mapped["User"] = relationship(back_populates="addresses")
 
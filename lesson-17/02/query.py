@@ -0,0 +1,41 @@
+"""
+Query helpers for the User model, with a configurable loading strategy for
+User.addresses.
+"""
+
+from model import User
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import subqueryload
+
+# how User.addresses is loaded
+#   lazy:     one query per user, on first access (N+1)
+#   select:   one extra `WHERE user_id IN (...)` query per 500 users
+#   joined:   a LEFT OUTER JOIN in the same query, user columns repeat per address
+#   subquery: one extra query that repeats the user query as a subquery
+LOADERS = {
+    "lazy": lazyload,
+    "select": selectinload,
+    "joined": joinedload,
+    "subquery": subqueryload,
+}
+
+def users_aged(session: Session, min_age: int, addresses: str | None = "select") -> list[User]:
+    """
+    Users aged min_age or older.
+
+    addresses is the loading strategy of User.addresses (a key of LOADERS),
+    or None to keep the strategy configured on the relationship.
+    """
+
+    stmt = select(User).where(User.age >= min_age).order_by(User.id)
+    if addresses is not None:
+        if addresses not in LOADERS:
+            raise ValueError("Unknown loading strategy: {}, expected one of {}".format(addresses, ", ".join(LOADERS)))
+        stmt = stmt.options(LOADERS[addresses](User.addresses))
+
+    # a joined collection repeats every user once per address
+    return list(session.scalars(stmt).unique())
@@ -0,0 +1,65 @@
+import pytest
+from counter import QueryCounter
+from model import Address
+from model import Base
+from model import User
+from query import users_aged
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+USERS = 20
+
+##############################
+# Fixtures
+##############################
+@pytest.fixture(scope="function")
+def engine():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            User(
+                name="user{}".format(i),
+                age=20 + i,
+                addresses=[Address(email_address="user{}.{}@example.com".format(i, j)) for j in range(2)],
+            )
+            for i in range(USERS)
+        ])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+def load_addresses(engine, addresses: str) -> list:
+    with Session(engine) as session:
+        users = users_aged(session, 30, addresses=addresses)
+        return [address.email_address for user in users for address in user.addresses]
+
+##############################
+# Query Count Testcases
+##############################
+@pytest.mark.parametrize("addresses", ["select", "joined"])
+def test_eager_loading_stays_within_bound(engine, addresses):
+    """
+    The testcase is to test that loading the users and their addresses
+    with selectin or joined loading takes at most 2 queries.
+    """
+
+    with QueryCounter(engine, limit=2) as queries:
+        emails = load_addresses(engine, addresses)
+    assert len(emails) == (USERS - 10) * 2
+    assert queries.count <= 2
+
+def test_lazy_loading_exceeds_bound(engine):
+    """
+    The testcase is to test that lazy loading runs one query per user, which
+    the counter reports as an N+1 regression.
+    """
+
+    with pytest.raises(AssertionError, match=r"Expected at most 2 queries, executed 11"):
+        with QueryCounter(engine, limit=2):
+            load_addresses(engine, "lazy")
+
+def test_counter_without_limit(engine):
+    with QueryCounter(engine) as queries:
+        load_addresses(engine, "lazy")
+    assert queries.count == 1 + (USERS - 10)
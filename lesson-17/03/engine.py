@@ -0,0 +1,146 @@
+"""
+Engine factory with explicit pool settings and pool metrics.
+"""
+
+from bisect import bisect_left
+import threading
+import time
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# upper bounds (ms) of the buckets of the wait time histogram, the last bucket is unbounded
+WAIT_BUCKETS = (0.1, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+class PoolMetrics:
+
+    def __init__(self, pool_size: int):
+        """
+        Counters of one pool, updated from pool events.
+
+        checked_out is the number of connections in use. Connections in use
+        beyond pool_size are overflow connections, which are closed when they
+        are returned. wait is a histogram of the time to get a connection
+        from the pool, which includes connecting and the pre-ping.
+        """
+
+        self.pool_size = pool_size
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidated = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.wait = [0] * (len(WAIT_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    @property
+    def overflow(self) -> int:
+        return max(self.checked_out - self.pool_size, 0)
+
+    @property
+    def peak_overflow(self) -> int:
+        return max(self.peak_checked_out - self.pool_size, 0)
+
+    def wait_percentile(self, percent: float) -> float:
+        """Upper bound (ms) of the bucket holding the percentile, inf for the last bucket."""
+        total = sum(self.wait)
+        if not total:
+            return 0.0
+        rank = total * percent / 100
+        seen = 0
+        for bound, count in zip(WAIT_BUCKETS + (float("inf"),), self.wait):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "invalidated": self.invalidated,
+                "checked_out": self.checked_out,
+                "overflow": self.overflow,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "wait_ms": dict(zip(["<={}".format(b) for b in WAIT_BUCKETS] + [">{}".format(WAIT_BUCKETS[-1])], self.wait)),
+            }
+
+    def observe_wait(self, seconds: float):
+        with self._lock:
+            self.wait[bisect_left(WAIT_BUCKETS, seconds * 1000)] += 1
+
+    def on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out -= 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidated += 1
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long connect() waits for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics(self.size())
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # dispose() and disconnects replace the pool, the listeners are copied
+        # with its dispatch, and the metrics are kept with them
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+def create_pooled_engine(url: str, pool_size: int = 5, max_overflow: int = 10, pool_timeout: float = 30,
+                         pool_recycle: int = 3600, pool_pre_ping: bool = True, **kwargs) -> Engine:
+    """
+    Create an engine with explicit pool settings.
+
+    pool_size connections are kept open, up to max_overflow more are opened
+    under load and closed when returned, and a caller waits at most
+    pool_timeout seconds for a connection. Connections older than
+    pool_recycle seconds are replaced before a server closes them (MySQL
+    wait_timeout), and pool_pre_ping tests every connection on checkout.
+    The metrics are available as `pool_metrics(engine)`.
+    """
+
+    engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        **kwargs,
+    )
+
+    metrics = engine.pool.metrics
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
+    return engine
+
+def pool_metrics(engine: Engine) -> PoolMetrics:
+    return engine.pool.metrics
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
+from engine import create_pooled_engine
+from engine import pool_metrics
 from model import User
 from model import Address
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 ##############################
@@ -14,12 +15,27 @@ HOST = "localhost"
 PORT = 3306
 DATABASE = "demo"
 
+##############################
+# Pool Settings
+##############################
+POOL_SIZE = 5         # connections kept open
+MAX_OVERFLOW = 10     # extra connections under load, closed when returned
+POOL_RECYCLE = 3600   # seconds, below the MySQL wait_timeout (8 hours by default)
+POOL_PRE_PING = True  # test a connection before handing it out
+
 ##############################
 # Main
 ##############################
 if __name__ == "__main__":
-    # Create an MySQL database in memory
-    engine = create_engine(f"mysql+pymysql://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE}", echo=False)
+    # Connect to the MySQL database through a connection pool
+    engine = create_pooled_engine(
+        f"mysql+pymysql://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE}",
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=POOL_PRE_PING,
+        echo=False,
+    )
 
     # Create all tables defined in the model
     from model import Base
@@ -60,3 +76,5 @@ if __name__ == "__main__":
                 print("  ", address)
 
         # auto close session
+
+    print("Pool metrics: {}".format(pool_metrics(engine).snapshot()))
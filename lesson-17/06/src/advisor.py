@@ -0,0 +1,193 @@
+"""
+Check the plans of registered queries with `EXPLAIN QUERY PLAN`.
+
+A query whose plan scans a table is flagged, and a covering index is
+proposed from the columns the query filters on and reads. The proposal is
+verified by creating the index inside a savepoint, explaining the query
+again and rolling back.
+
+The SQL is parsed with regular expressions, so only simple SELECT
+statements (joins, no subqueries) get a proposal.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+import re
+import sqlite3
+
+try:
+    from sqlalchemy.dialects import sqlite as sqlite_dialect
+except ImportError:
+    sqlite_dialect = None
+
+# "SCAN user", "SCAN TABLE user" (before SQLite 3.36), "SCAN u USING COVERING INDEX ..."
+PLAN_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+CLAUSE = re.compile(r"\b(SELECT|FROM|WHERE|GROUP BY|HAVING|ORDER BY|LIMIT)\b", re.IGNORECASE)
+TABLE = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+JOIN_ON = re.compile(r"\bON\b(.*?)(?=\b(?:LEFT|RIGHT|INNER|OUTER|CROSS|JOIN)\b|$)", re.IGNORECASE | re.DOTALL)
+COLUMN = re.compile(r'(?:"?(\w+)"?\.)?"?([A-Za-z_]\w*)"?')
+EQUALITY = re.compile(r"(?<![<>!=])==?(?!=)|\bIN\b|\bIS\b", re.IGNORECASE)
+KEYWORDS = {"AS", "ON", "WHERE", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS", "NATURAL", "USING"}
+
+@dataclass
+class Query:
+    name: str
+    sql: str
+    parameters: tuple = ()
+
+@dataclass
+class Finding:
+    query: Query
+    plan: list[str]
+    scans: list[str] = field(default_factory=list)
+    suggestions: list[str] = field(default_factory=list)
+    verified: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.scans
+
+    def __str__(self) -> str:
+        lines = ["{}: {}".format(self.query.name, "ok" if self.ok else "full scan of " + ", ".join(self.scans))]
+        lines += ["  plan: " + step for step in self.plan]
+        for suggestion in self.suggestions:
+            lines.append("  suggest: {}{}".format(suggestion, "" if self.verified else "  (not verified)"))
+        return "\n".join(lines)
+
+# registered queries, by name
+QUERIES: dict[str, Query] = {}
+
+def register(name: str, statement, parameters: tuple = ()) -> Query:
+    """
+    Register a query to be checked.
+
+    statement is SQL text, or a SQLAlchemy statement (e.g. `select(User)`
+    or `session.query(User).statement`), which is compiled for SQLite with
+    its parameters inlined.
+    """
+
+    if not isinstance(statement, str):
+        if sqlite_dialect is None:
+            raise RuntimeError("SQLAlchemy is required to register a SQLAlchemy statement")
+        statement = str(statement.compile(dialect=sqlite_dialect.dialect(), compile_kwargs={"literal_binds": True}))
+
+    query = Query(name, " ".join(statement.split()), tuple(parameters))
+    QUERIES[name] = query
+    return query
+
+def explain(con: sqlite3.Connection, query: Query) -> list[str]:
+    """The steps of the query plan, as printed by the sqlite3 shell."""
+    rows = con.execute("EXPLAIN QUERY PLAN " + query.sql, query.parameters).fetchall()
+    return [row[3] for row in rows]
+
+def full_scans(plan: list[str]) -> list[str]:
+    """Tables (or aliases) the plan reads from start to end."""
+    return [m.group(1) for m in map(PLAN_SCAN.match, plan) if m]
+
+def _clauses(sql: str) -> dict[str, str]:
+    parts = CLAUSE.split(sql)
+    clauses = {}
+    for keyword, text in zip(parts[1::2], parts[2::2]):
+        clauses.setdefault(" ".join(keyword.upper().split()), text)
+    return clauses
+
+def _tables(from_clause: str) -> dict[str, str]:
+    """Map every name a table is referred to by (alias or name) to the table."""
+    tables = {}
+    for m in TABLE.finditer("FROM " + from_clause):
+        table, alias = m.group(1), m.group(2)
+        tables[table] = table
+        if alias and alias.upper() not in KEYWORDS:
+            tables[alias] = table
+    return tables
+
+def _columns(text: str, names: set[str], columns: list[str]) -> list[str]:
+    """Columns of one table referenced in text, qualified by one of names or unqualified."""
+    found = []
+    for m in COLUMN.finditer(text):
+        qualifier, column = m.group(1), m.group(2)
+        if column in columns and (qualifier is None or qualifier in names) and column not in found:
+            found.append(column)
+    return found
+
+def suggest_index(con: sqlite3.Connection, query: Query, scanned: str) -> str | None:
+    """
+    Propose a covering index for the table the plan scans.
+
+    Columns compared for equality come first, then the first range column,
+    then every other column the query reads, so that the table itself is
+    not visited. Returns None when the query does not filter the table.
+    """
+
+    clauses = _clauses(query.sql)
+    tables = _tables(clauses.get("FROM", ""))
+    table = tables.get(scanned, scanned)
+    names = {name for name, target in tables.items() if target == table}
+
+    info = con.execute("SELECT name, type, pk FROM pragma_table_info(?)", (table,)).fetchall()
+    columns = [name for name, _, _ in info]
+    # an INTEGER PRIMARY KEY is the rowid, which every index already holds
+    keys = [name for name, _, pk in info if pk]
+    rowid = keys[0] if len(keys) == 1 and next(t for n, t, _ in info if n == keys[0]).upper() == "INTEGER" else None
+
+    filters = [clauses.get("WHERE", "")] + JOIN_ON.findall(clauses.get("FROM", ""))
+    equal, ranges = [], []
+    for predicate in re.split(r"\bAND\b", " AND ".join(filter(None, filters)), flags=re.IGNORECASE):
+        for column in _columns(predicate, names, columns):
+            target = equal if EQUALITY.search(predicate) else ranges
+            if column not in equal and column not in ranges:
+                target.append(column)
+
+    if not equal and not ranges:
+        return None
+
+    read = clauses.get("SELECT", "")
+    if re.search(r"(?:^|[\s,.])\*", read):
+        read = " ".join(columns)
+    others = ranges[1:] + _columns(" ".join([read] + [clauses.get(k, "") for k in ("GROUP BY", "HAVING", "ORDER BY")]), names, columns)
+
+    index = []
+    for column in equal + ranges[:1] + others:
+        if column != rowid and column not in index:
+            index.append(column)
+    if not index:
+        return None
+
+    return "CREATE INDEX ix_{}_{} ON {}({})".format(table, "_".join(index), table, ", ".join(index))
+
+def check(con: sqlite3.Connection, query: Query) -> Finding:
+    """Explain the query, and for each scanned table propose and verify an index."""
+    plan = explain(con, query)
+    finding = Finding(query, plan, full_scans(plan))
+    if finding.ok:
+        return finding
+
+    finding.suggestions = [s for s in (suggest_index(con, query, scanned) for scanned in finding.scans) if s]
+    if finding.suggestions:
+        # DDL is transactional in SQLite, so the indexes can be tried and dropped again
+        con.execute("SAVEPOINT advisor")
+        try:
+            for suggestion in finding.suggestions:
+                con.execute(suggestion)
+            remaining = full_scans(explain(con, query))
+            finding.verified = not set(remaining) & set(finding.scans)
+        finally:
+            con.execute("ROLLBACK TO advisor")
+            con.execute("RELEASE advisor")
+    return finding
+
+def check_all(con: sqlite3.Connection, names: list[str] | None = None) -> list[Finding]:
+    return [check(con, QUERIES[name]) for name in (names or QUERIES)]
+
+def assert_no_full_scan(con: sqlite3.Connection, query: Query | str):
+    """
+    Fail when a registered query scans a table.
+
+    Meant for pytest: the assertion message holds the plan and the proposed
+    index.
+    """
+
+    if isinstance(query, str):
+        query = QUERIES[query]
+    finding = check(con, query)
+    assert finding.ok, str(finding)
@@ -0,0 +1,24 @@
+"""
+Load the modules of lesson-17/02 from their files, so the checks guard the
+real model rather than a copy.
+"""
+
+import importlib.util
+from pathlib import Path
+import sys
+
+LESSON_02 = Path(__file__).resolve().parents[2] / "02"
+
+def load(name: str):
+    """Import LESSON_02/<name>.py as the module name."""
+    path = LESSON_02 / "{}.py".format(name)
+    module = sys.modules.get(name)
+    if module is not None and Path(getattr(module, "__file__", "")).resolve() == path:
+        return module
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # registered before running it, like an import, so every user shares one module
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+import sqlite3
+
+from advisor import check_all
+import queries
+
+if __name__ == "__main__":
+    con = sqlite3.connect(":memory:")
+    queries.create_schema(con, indexes=False)
+    print("Without indexes:")
+    for finding in check_all(con):
+        print(finding)
+
+    con = sqlite3.connect(":memory:")
+    queries.create_schema(con)
+    print("\nWith the indexes of the model:")
+    for finding in check_all(con):
+        print(finding)
@@ -0,0 +1,34 @@
+"""
+The queries of lesson-17/01 and lesson-17/02, registered for the advisor.
+"""
+
+import sqlite3
+
+from advisor import register
+from lesson02 import load
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import CreateTable
+
+model = load("model")
+Address, Base, User = model.Address, model.Base, model.User
+
+# lesson-17/01, raw SQL
+register("users aged 30+ (sqlite3)", "SELECT name, age FROM user WHERE age >= ?", (30,))
+
+# lesson-17/02, session.query(User).filter(User.age >= 30)
+register("users aged 30+ (SQLAlchemy)", select(User).where(User.age >= 30))
+
+# lesson-17/02, lazy load of user.addresses
+register("addresses of a user (SQLAlchemy)", select(Address).where(Address.user_id == 1))
+
+def create_schema(con: sqlite3.Connection, indexes: bool = True):
+    """Create the tables of the model, with or without its indexes."""
+    dialect = sqlite.dialect()
+    for table in Base.metadata.sorted_tables:
+        con.execute(str(CreateTable(table).compile(dialect=dialect)))
+        if indexes:
+            for index in table.indexes:
+                con.execute(str(CreateIndex(index).compile(dialect=dialect)))
+    con.commit()
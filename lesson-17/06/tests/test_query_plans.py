@@ -0,0 +1,84 @@
+import sqlite3
+import pytest
+from advisor import Query
+from advisor import QUERIES
+from advisor import assert_no_full_scan
+from advisor import check
+from advisor import check_all
+from advisor import suggest_index
+import queries
+
+##############################
+# Fixtures
+##############################
+@pytest.fixture(scope="function")
+def con():
+    con = sqlite3.connect(":memory:")
+    queries.create_schema(con)
+    yield con
+    con.close()
+
+@pytest.fixture(scope="function")
+def con_without_indexes():
+    con = sqlite3.connect(":memory:")
+    queries.create_schema(con, indexes=False)
+    yield con
+    con.close()
+
+##############################
+# Regression Testcases
+##############################
+@pytest.mark.parametrize("name", list(QUERIES))
+def test_registered_query_does_not_scan(con, name):
+    """
+    The testcase is to test that no registered query scans a table with the
+    indexes of the model.
+    """
+
+    assert_no_full_scan(con, name)
+
+##############################
+# Advisor Testcases
+##############################
+def test_full_scans_are_flagged(con_without_indexes):
+    findings = check_all(con_without_indexes)
+    assert findings
+    for finding in findings:
+        assert not finding.ok
+        assert finding.suggestions
+        assert finding.verified
+
+def test_assert_no_full_scan_fails_on_scan(con_without_indexes):
+    with pytest.raises(AssertionError, match=r"suggest: CREATE INDEX ix_user_age_name ON user\(age, name\)"):
+        assert_no_full_scan(con_without_indexes, "users aged 30+ (sqlite3)")
+
+def test_covering_index_is_proposed(con_without_indexes):
+    """
+    The testcase is to test that equality columns lead the proposal, the
+    range column follows, and the rowid is left out.
+    """
+
+    query = Query("by name and age", "SELECT id, age FROM user WHERE age > ? AND name = ?", (30, "alice"))
+    assert suggest_index(con_without_indexes, query, "user") == "CREATE INDEX ix_user_name_age ON user(name, age)"
+    assert check(con_without_indexes, query).verified
+
+def test_join_with_alias(con_without_indexes):
+    query = Query(
+        "addresses of old users",
+        "SELECT a.email_address FROM user AS u JOIN address AS a ON a.user_id = u.id WHERE u.age >= ?",
+        (60,),
+    )
+    finding = check(con_without_indexes, query)
+    assert not finding.ok
+    assert "CREATE INDEX ix_address_user_id_email_address ON address(user_id, email_address)" in finding.suggestions
+
+def test_no_proposal_without_filter(con_without_indexes):
+    query = Query("all users", "SELECT * FROM user")
+    finding = check(con_without_indexes, query)
+    assert not finding.ok
+    assert finding.suggestions == []
+
+def test_proposal_is_rolled_back(con_without_indexes):
+    check_all(con_without_indexes)
+    indexes = con_without_indexes.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    assert indexes == []
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# Requests per second and event loop lag of the async repository, compared
+# with a sync Session offloaded to threads and a sync Session on the loop
+
+import argparse
+import asyncio
+from pathlib import Path
+import random
+import tempfile
+import time
+from model import Address
+from model import Base
+from model import User
+from repository import UserRepository
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload
+
+def populate(path: Path, count: int):
+    engine = create_engine("sqlite:///{}".format(path))
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(insert(User), [{"id": i, "name": "user{}".format(i), "age": 18 + i % 70} for i in range(1, count + 1)])
+        session.execute(insert(Address), [{"email_address": "user{}@example.com".format(i), "user_id": i} for i in range(1, count + 1)])
+        session.commit()
+    engine.dispose()
+
+def sync_get(engine, user_id: int) -> User | None:
+    with Session(engine, expire_on_commit=False) as session:
+        return session.get(User, user_id, options=[selectinload(User.addresses)])
+
+async def monitor(lags: list, interval: float = 0.001):
+    # how late the loop wakes up a task that sleeps for `interval`
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+async def run(name: str, request, requests: int, concurrency: int, users: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    lags = []
+
+    async def one(user_id):
+        async with semaphore:
+            user = await request(user_id)
+            assert user.id == user_id and user.addresses
+
+    probe = asyncio.create_task(monitor(lags))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(one(random.randint(1, users)) for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    # let the probe record the wake-up it was waiting for
+    await asyncio.sleep(0.01)
+    probe.cancel()
+
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(int(len(lags) * 0.99), len(lags) - 1)]
+    print("{:24} {:10,.0f} {:>9.1f} ms {:>9.1f} ms".format(name, requests / elapsed, p99 * 1000, lags[-1] * 1000))
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load test the async repository against a sync Session.")
+    parser.add_argument("--users", type=int, default=10_000, help="Users in the database (default: 10000).")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests in total (default: 5000).")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests in flight (default: 100).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "users.db"
+        populate(path, args.users)
+
+        async_engine = create_async_engine("sqlite+aiosqlite:///{}".format(path))
+        async_session = async_sessionmaker(async_engine, expire_on_commit=False)
+        sync_engine = create_engine("sqlite:///{}".format(path))
+
+        async def async_get(user_id):
+            async with async_session() as session:
+                return await UserRepository(session).get(user_id)
+
+        async def thread_get(user_id):
+            return await asyncio.to_thread(sync_get, sync_engine, user_id)
+
+        async def blocking_get(user_id):
+            return sync_get(sync_engine, user_id)
+
+        print("GET of {:,} random users, {} in flight".format(args.requests, args.concurrency))
+        print("{:24} {:>10} {:>12} {:>12}".format("session", "req/s", "lag p99", "lag max"))
+        await run("AsyncSession", async_get, args.requests, args.concurrency, args.users)
+        await run("Session in threads", thread_get, args.requests, args.concurrency, args.users)
+        await run("Session on the loop", blocking_get, args.requests, args.concurrency, args.users)
+
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""
+Async data access for the users API, over the User/Address models of
+lesson-17.
+
+Handlers await the repository, so the event loop keeps serving other
+requests while a query runs. A sync `Session` would block the loop for
+the duration of every query.
+"""
+
+import asyncio
+import os
+from model import Address
+from model import Base
+from model import User
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import selectinload
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+aiosqlite:///users.db")
+
+engine = create_async_engine(DATABASE_URL, echo=False)
+# objects stay readable after commit, there is no lazy loading in async code
+Session = async_sessionmaker(engine, expire_on_commit=False)
+# attempts to seed the example users while another worker holds the SQLite lock
+SEED_ATTEMPTS = 5
+
+class UserRepository:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list(self) -> list[User]:
+        result = await self.session.scalars(select(User).options(selectinload(User.addresses)).order_by(User.id))
+        return list(result)
+
+    async def get(self, user_id: int) -> User | None:
+        return await self.session.get(User, user_id, options=[selectinload(User.addresses)])
+
+    async def add(self, name: str, email: str, age: int = 0) -> User:
+        user = User(name=name, age=age, addresses=[Address(email_address=email)])
+        self.session.add(user)
+        await self.session.commit()
+        return user
+
+async def init_db():
+    """Create the tables and the example users, once for all workers."""
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    except OperationalError as e:
+        # another worker created a table between the check and CREATE TABLE
+        if "already exists" not in str(e.orig):
+            raise
+
+    for attempt in range(SEED_ATTEMPTS):
+        async with Session() as session:
+            session.add_all([
+                User(id=1, name="Alice", age=30, addresses=[Address(email_address="alice@example.com")]),
+                User(id=2, name="Bob", age=25, addresses=[Address(email_address="bob@example.com")]),
+            ])
+            try:
+                await session.commit()
+                return
+            except IntegrityError:
+                # already there
+                await session.rollback()
+                return
+            except OperationalError as e:
+                # SQLite: another worker is writing, try again
+                await session.rollback()
+                if "database is locked" not in str(e.orig) or attempt == SEED_ATTEMPTS - 1:
+                    raise
+        await asyncio.sleep(0.1 * 2 ** attempt)
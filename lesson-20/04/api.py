@@ -5,14 +5,49 @@ from quart import jsonify
 from quart import request
 from quart import render_template_string
 from datetime import datetime
+from model import Address
+from model import User
+from repository import Session
+from repository import UserRepository
+from repository import engine
+from repository import init_db
 
 app = Quart(__name__)
 
-# Simulated in-memory "database" of users
-users = [
-    {"id": 1, "name": "Alice", "email": "alice@example.com"},
-    {"id": 2, "name": "Bob", "email": "bob@example.com"},
-]
+# lengths of the String columns of the model
+NAME_LENGTH = User.__table__.c.name.type.length
+EMAIL_LENGTH = Address.__table__.c.email_address.type.length
+MAX_AGE = 150
+
+@app.before_serving
+async def startup():
+    await init_db()
+
+@app.after_serving
+async def shutdown():
+    await engine.dispose()
+
+def _validate_user(data) -> str | None:
+    """The error of a new user in a request body, None when it is valid."""
+    if not isinstance(data, dict) or "name" not in data or "email" not in data:
+        return "Missing name or email"
+
+    name, email, age = data["name"], data["email"], data.get("age", 0)
+    if not isinstance(name, str) or not name.strip() or len(name) > NAME_LENGTH:
+        return "name must be a non-empty string of at most {} characters".format(NAME_LENGTH)
+    if not isinstance(email, str) or "@" not in email or len(email) > EMAIL_LENGTH:
+        return "email must be an email address of at most {} characters".format(EMAIL_LENGTH)
+    # bool is a subclass of int, but true is not an age
+    if not isinstance(age, int) or isinstance(age, bool) or not 0 <= age <= MAX_AGE:
+        return "age must be an integer from 0 to {}".format(MAX_AGE)
+    return None
+
+def _user_json(user) -> dict:
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.addresses[0].email_address if user.addresses else None,
+    }
 
 @app.route("/", methods=["GET"])
 async def home():
@@ -45,23 +80,26 @@ async def home():
 
 @app.route("/api/users", methods=["GET"])
 async def get_users():
-    return jsonify(users)
+    async with Session() as session:
+        users = await UserRepository(session).list()
+        return jsonify([_user_json(u) for u in users])
 
 @app.route("/api/users/<int:user_id>", methods=["GET"])
 async def get_user(user_id):
-    user = next((u for u in users if u["id"] == user_id), None)
+    async with Session() as session:
+        user = await UserRepository(session).get(user_id)
     if user:
-        return jsonify(user)
+        return jsonify(_user_json(user))
     else:
         return jsonify({"error": "User not found"}), 404
 
 @app.route("/api/users", methods=["POST"])
 async def add_user():
-    data = await request.get_json()
-    if not data or "name" not in data or "email" not in data:
-        return jsonify({"error": "Missing name or email"}), 400
+    data = await request.get_json(silent=True)
+    error = _validate_user(data)
+    if error:
+        return jsonify({"error": error}), 400
 
-    new_id = max(u["id"] for u in users) + 1 if users else 1
-    new_user = {"id": new_id, "name": data["name"], "email": data["email"]}
-    users.append(new_user)
-    return jsonify(new_user), 201
+    async with Session() as session:
+        new_user = await UserRepository(session).add(data["name"], data["email"], data.get("age", 0))
+        return jsonify(_user_json(new_user)), 201
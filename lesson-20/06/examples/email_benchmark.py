@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Compare PATTERN_EMAIL with the DFA validator on typical and worst-case input
+
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from email_address import is_valid_email  # noqa: E402
+from model import PATTERN_EMAIL  # noqa: E402
+
+# up to max_length=320 characters, the limit of the Email type
+INPUTS = {
+    "typical": "alice@example.com",
+    "typical, long": "first.middle.last@mail.department.example.com",
+    "320 chars, valid": "a" * 64 + "@" + ".".join(["b" * 62] * 4) + ".cc",
+    "320 chars, no @": "a" * 320,
+    "320 chars, invalid end": "a@" + "b." * 158 + "(",
+    "dotted local, no @": "a." * 159 + "a!",
+    "quoted escapes, open": '"' + "\\a" * 159 + "a",
+    "domain literal, open": "a@[" + "\\a" * 158 + "a",
+    "320 chars, quoted": '"' + "a b" * 100 + '"@example.com',
+}
+
+if __name__ == "__main__":
+    number = 20_000
+    print("{:24} {:>6} {:>12} {:>12}".format("input", "valid", "regex µs", "DFA µs"))
+    for name, value in INPUTS.items():
+        assert len(value) <= 320
+        valid = is_valid_email(value)
+        assert valid == bool(PATTERN_EMAIL.match(value)), name
+        regex = timeit.timeit(lambda: PATTERN_EMAIL.match(value), number=number) / number
+        dfa = timeit.timeit(lambda: is_valid_email(value), number=number) / number
+        print("{:24} {:>6} {:12.2f} {:12.2f}".format(name, str(valid), regex * 1e6, dfa * 1e6))
@@ -302,8 +302,8 @@ def _list_users() -> list[User]:
     """List all users."""
     # Simulate fetching users from a data source
     users = [
-        User(id_=1, name="Alice", email="alice@example.com"),
-        User(id_=2, name="Bob", email="bob@example.com"),
+        User(id=1, name="Alice", email="alice@example.com"),
+        User(id=2, name="Bob", email="bob@example.com"),
     ]
     return sorted(users, key=lambda u: u.name)
 
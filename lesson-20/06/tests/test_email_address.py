@@ -0,0 +1,95 @@
+import random
+import pytest
+from pydantic import ValidationError
+from email_address import is_valid_email
+from model import PATTERN_EMAIL
+from model import User
+
+
+##############################
+# Fuzz Corpus
+##############################
+# every character class of the grammar, and characters around its edges
+ALPHABET = [
+    "a", "Z", "0", "-", "_", "+", "!", ".", "@", '"', "\\", "[", "]", "(", ")", ",", ":", ";", "<", ">",
+    " ", "\t", "\r", "\n", "\x00", "\x7f", "\x80", "\xe9", "\xff", "ā", "中", "\U0001f600", "\ud800",
+]
+PARTS = ["alice", "example", "com", '"a b"', '"a\\"b"', "[1.2.3.4]", "[a\\]b]", "中文"]
+
+def corpus(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            # random characters
+            values.append("".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 12))))
+        else:
+            # plausible addresses with a few random edits
+            value = ".".join(rng.choice(PARTS) for _ in range(rng.randint(1, 3)))
+            value += "@" + ".".join(rng.choice(PARTS) for _ in range(rng.randint(1, 3)))
+            for _ in range(rng.randint(0, 2)):
+                i = rng.randint(0, len(value))
+                value = value[:i] + rng.choice(ALPHABET) + value[i + rng.randint(0, 1):]
+            values.append(value)
+    return values
+
+
+##############################
+# Testcases
+##############################
+@pytest.mark.parametrize("value", [
+    "alice@example.com",
+    "first.last@sub.example.com",
+    '"john doe"@example.com',
+    '"a\\"b"@[127.0.0.1]',
+    "中文@example.com",
+    "alice@example.com\n",
+])
+def test_valid_email(value):
+    """
+    The testcase is to test addresses the grammar accepts.
+    """
+
+    assert is_valid_email(value)
+    assert PATTERN_EMAIL.match(value)
+
+@pytest.mark.parametrize("value", [
+    "",
+    "alice",
+    "alice@",
+    "@example.com",
+    "alice..bob@example.com",
+    "alice@example.com.",
+    "al ice@example.com",
+    "\xe9@example.com",
+    '"unterminated@example.com',
+    "alice@example.com\n\n",
+])
+def test_invalid_email(value):
+    """
+    The testcase is to test addresses the grammar rejects.
+    """
+
+    assert not is_valid_email(value)
+    assert not PATTERN_EMAIL.match(value)
+
+def test_agrees_with_regex():
+    """
+    The testcase is to test that the validator agrees with PATTERN_EMAIL on a fuzz corpus.
+    """
+
+    values = corpus(20_000)
+    assert any(PATTERN_EMAIL.match(value) for value in values)
+    for value in values:
+        assert is_valid_email(value) == bool(PATTERN_EMAIL.match(value)), repr(value)
+
+def test_user_email():
+    """
+    The testcase is to test the validation of the Email type of User.
+    """
+
+    user = User.model_validate({"id": 1, "name": "Alice", "email": " alice@example.com "})
+    assert user.email == "alice@example.com"
+
+    with pytest.raises(ValidationError):
+        User.model_validate({"id": 1, "name": "Alice", "email": "alice@@example.com"})
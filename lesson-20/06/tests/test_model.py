@@ -0,0 +1,35 @@
+import json
+import pytest
+from pydantic import ValidationError
+from model import User
+from model import users_from_json
+
+
+##############################
+# Testcases
+##############################
+def test_users_from_json():
+    """
+    The testcase is to test validating a JSON array of users in one call.
+    """
+
+    data = json.dumps([
+        {"id": 1, "name": " Alice ", "email": "alice@example.com"},
+        {"id": 2, "name": "Bob", "email": "bob@example.com"},
+    ]).encode("utf-8")
+
+    users = users_from_json(data)
+    assert [user.id_ for user in users] == [1, 2]
+    assert users[0].name == "Alice"
+
+    with pytest.raises(ValidationError):
+        users_from_json(b'[{"id": 1, "name": "Alice", "email": "not an email"}]')
+
+def test_validate_assignment():
+    """
+    The testcase is to test that attribute writes are validated by default.
+    """
+
+    user = User.model_validate({"id": 1, "name": "Alice", "email": "alice@example.com"})
+    with pytest.raises(ValidationError):
+        user.email = "not an email"